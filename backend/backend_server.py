@@ -3,6 +3,7 @@ ToneBridge 백엔드 서버
 FastAPI 기반 REST API 서버
 """
 
+import asyncio
 import os
 import sys
 import time
@@ -37,7 +38,18 @@ from tonebridge_core import (VoiceProcessor, ProcessingPipeline,
                              KoreanSegmenter, TextGridGenerator, PitchAnalyzer)
 
 # 데이터베이스 모델
-from models import init_db, get_db, AudioFile, ProcessingResult, UserProfile
+from models import (init_db, get_db, begin_db_scope, end_db_scope,
+                    AudioFile, ProcessingResult, UserProfile)
+
+# N+1 쿼리 감지 (개발 모드 전용, 선택적 의존성)
+NPLUSONE_AVAILABLE = False
+if settings.DEBUG:
+    try:
+        import nplusone.ext.sqlalchemy  # noqa: F401  지연 로딩 감시 등록
+        from nplusone.core import profiler as nplusone_profiler
+        NPLUSONE_AVAILABLE = True
+    except ImportError:
+        pass
 
 logger = get_logger(__name__)
 
@@ -60,6 +72,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# 요청 단위 DB 세션
+@app.middleware("http")
+async def db_session_middleware(request: Request, call_next):
+    """요청마다 하나의 DB 세션 스코프를 열고 종료 시 정리"""
+    token = begin_db_scope()
+    try:
+        return await call_next(request)
+    finally:
+        end_db_scope(token)
+
+
+if NPLUSONE_AVAILABLE:
+
+    @app.middleware("http")
+    async def nplusone_middleware(request: Request, call_next):
+        """개발 모드: 요청 중 N+1 지연 로딩이 발생하면 NPlusOneError 발생
+
+        nplusone 은 스레드 단위로 감시하므로 async 핸들러에서 발생한
+        지연 로딩만 잡힙니다.
+        """
+        with nplusone_profiler.Profiler():
+            return await call_next(request)
+
+
 # 정적 파일 서빙
 app.mount("/static",
           StaticFiles(directory=str(settings.STATIC_DIR)),
@@ -393,8 +430,9 @@ async def compare_audio(request: ComparisonRequest):
         comparison = voice_analyzer.compare_audio_files(
             reference_path, target_path)
 
-        # 품질 검증
-        quality_result = quality_validator.pronunciation_validator.evaluate_pronunciation(
+        # 품질 검증 (CPU 연산이므로 이벤트 루프 밖에서 실행)
+        quality_result = await asyncio.to_thread(
+            quality_validator.pronunciation_validator.evaluate_pronunciation,
             target_path, reference_path)
 
         return ProcessResponse(
@@ -427,8 +465,9 @@ async def validate_quality(file_id: str):
     try:
         file_path = get_file_path(file_id)
 
-        # 품질 검증
-        validation_result = quality_validator.validate_comprehensive(file_path)
+        # 품질 검증 (CPU 연산이므로 이벤트 루프 밖에서 실행)
+        validation_result = await asyncio.to_thread(
+            quality_validator.validate_comprehensive, file_path)
 
         # 보고서 생성
         report = quality_validator.generate_report(validation_result)
@@ -667,8 +706,7 @@ async def get_reference_file_pitch(file_id: str, syllable_only: bool = False):
             # 기본 분석 실행
             try:
                 import librosa
-                y, sr = librosa.load(str(audio_file))
-                duration = len(y) / sr
+                duration = librosa.get_duration(path=str(audio_file))
                 
                 # 기본 피치 데이터 생성
                 if not syllable_only:
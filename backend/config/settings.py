@@ -149,6 +149,8 @@ class Settings:
     CACHE_TTL = 3600  # 초, 캐시 유효 시간
     CACHE_DIR = BACKEND_DIR / ".cache"
     CACHE_DIR.mkdir(exist_ok=True)
+    PITCH_CACHE_SIZE_LIMIT = "500M"  # 피치 분석 디스크 캐시 최대 크기
+    STAGE_CACHE_SIZE_LIMIT = 500 * 1024 * 1024  # 바이트, 파이프라인 단계 캐시 최대 크기
 
     # ========== 성능 설정 ==========
     MAX_WORKERS = os.cpu_count() or 4  # 멀티프로세싱 워커 수
@@ -184,19 +184,19 @@ class PitchAnalyzer:
                                    pitch_floor=self.pitch_floor,
                                    pitch_ceiling=self.pitch_ceiling)
 
-            # 시간 배열 생성
+            # 프레임 시간과 선택된 후보 (무성음 프레임은 주파수 0)
             times = pitch.xs()
-
-            # 피치 포인트 생성
-            pitch_points = []
-            for t in times:
-                f0 = pitch.get_value_at_time(t)
-                if f0 and not np.isnan(f0):
-                    strength = pitch.get_strength_at_time(t)
-                    pitch_points.append(
-                        PitchPoint(time=t,
-                                   frequency=f0,
-                                   strength=strength if strength else 0.0))
+            selected = pitch.selected_array
+            voiced = selected['frequency'] > 0
+
+            # 피치 포인트 생성 (유성음만)
+            pitch_points = [
+                PitchPoint(time=t, frequency=f0, strength=strength)
+                for t, f0, strength in zip(
+                    times[voiced].tolist(),
+                    selected['frequency'][voiced].tolist(),
+                    np.nan_to_num(selected['strength'][voiced]).tolist())
+            ]
 
             logger.debug(f"Praat 피치 추출 완료: {len(pitch_points)} 포인트")
             return pitch_points
@@ -259,15 +259,20 @@ class PitchAnalyzer:
                 'range': 0.0
             }
 
-        frequencies = [p.frequency for p in pitch_points]
+        # 한 번만 배열로 변환하여 모든 통계에 재사용
+        frequencies = np.fromiter((p.frequency for p in pitch_points),
+                                  dtype=np.float64,
+                                  count=len(pitch_points))
+        min_freq = float(frequencies.min())
+        max_freq = float(frequencies.max())
 
         return {
-            'mean': float(np.mean(frequencies)),
-            'std': float(np.std(frequencies)),
-            'min': float(np.min(frequencies)),
-            'max': float(np.max(frequencies)),
+            'mean': float(frequencies.mean()),
+            'std': float(frequencies.std()),
+            'min': min_freq,
+            'max': max_freq,
             'median': float(np.median(frequencies)),
-            'range': float(np.max(frequencies) - np.min(frequencies))
+            'range': max_freq - min_freq
         }
 
     @handle_errors(context="detect_gender")
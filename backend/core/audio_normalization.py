@@ -85,31 +85,12 @@ class AudioNormalizer:
             audio = AudioSegment.from_file(str(audio_path))
             original_duration = len(audio)
 
-            # 무음 임계값 설정
-            if silence_thresh is None:
-                silence_thresh = self.silence_threshold
-
-            # 무음이 아닌 구간 검출
-            nonsilent_ranges = detect_nonsilent(
-                audio,
-                min_silence_len=min_silence_len,
-                silence_thresh=silence_thresh,
-                seek_step=1
-            )
-
-            if not nonsilent_ranges:
+            processed_audio = self._strip_silence(audio, min_silence_len,
+                                                  silence_thresh, keep_silence)
+            if processed_audio is None:
                 logger.warning(f"전체가 무음으로 감지됨: {audio_path}")
                 return audio_path, 1.0
 
-            # 무음 제거된 오디오 생성
-            processed_audio = AudioSegment.empty()
-
-            for start_i, end_i in nonsilent_ranges:
-                # 앞뒤로 약간의 무음 유지
-                start_i = max(0, start_i - keep_silence)
-                end_i = min(len(audio), end_i + keep_silence)
-                processed_audio += audio[start_i:end_i]
-
             # 출력 경로 설정
             if output_path is None:
                 output_path = audio_path.parent / f"{audio_path.stem}_nosilence.wav"
@@ -135,6 +116,40 @@ class AudioNormalizer:
         except Exception as e:
             raise AudioProcessingError(f"무음 제거 실패: {str(e)}")
 
+    def _strip_silence(
+        self,
+        audio: AudioSegment,
+        min_silence_len: int = 500,
+        silence_thresh: Optional[float] = None,
+        keep_silence: int = 100
+    ) -> Optional[AudioSegment]:
+        """무음이 아닌 구간만 이어붙인 오디오 (전체가 무음이면 None)"""
+        # 무음 임계값 설정
+        if silence_thresh is None:
+            silence_thresh = self.silence_threshold
+
+        # 무음이 아닌 구간 검출
+        nonsilent_ranges = detect_nonsilent(
+            audio,
+            min_silence_len=min_silence_len,
+            silence_thresh=silence_thresh,
+            seek_step=1
+        )
+
+        if not nonsilent_ranges:
+            return None
+
+        # 무음 제거된 오디오 생성
+        processed_audio = AudioSegment.empty()
+
+        for start_i, end_i in nonsilent_ranges:
+            # 앞뒤로 약간의 무음 유지
+            start_i = max(0, start_i - keep_silence)
+            end_i = min(len(audio), end_i + keep_silence)
+            processed_audio += audio[start_i:end_i]
+
+        return processed_audio
+
     @handle_errors(context="normalize_volume")
     @log_execution_time
     def normalize_volume(
@@ -190,6 +205,75 @@ class AudioNormalizer:
         except Exception as e:
             raise AudioProcessingError(f"볼륨 정규화 실패: {str(e)}")
 
+    @handle_errors(context="remove_silence_and_normalize")
+    @log_execution_time
+    def remove_silence_and_normalize(
+        self,
+        audio_path: Path,
+        output_path: Optional[Path] = None,
+        remove_silence: bool = True,
+        normalize_volume: bool = True,
+        target_dBFS: Optional[float] = None
+    ) -> Tuple[Path, float]:
+        """
+        무음 제거와 볼륨 정규화를 한 번의 디코딩/인코딩으로 처리
+
+        Args:
+            audio_path: 입력 오디오 파일 경로
+            output_path: 출력 파일 경로
+            remove_silence: 무음 제거 여부
+            normalize_volume: 볼륨 정규화 여부
+            target_dBFS: 목표 볼륨 (dBFS)
+
+        Returns:
+            (output_path, ratio): 출력 파일 경로와 무음 제거 후 길이 비율
+        """
+        if not (remove_silence or normalize_volume):
+            return audio_path, 1.0
+
+        try:
+            # 오디오 로드 (한 번)
+            audio = AudioSegment.from_file(str(audio_path))
+            original_duration = len(audio)
+            ratio = 1.0
+
+            # 무음 제거
+            if remove_silence:
+                stripped = self._strip_silence(audio)
+                if stripped is None:
+                    logger.warning(f"전체가 무음으로 감지됨: {audio_path}")
+                else:
+                    audio = stripped
+                    if original_duration > 0:
+                        ratio = len(audio) / original_duration
+
+            # 볼륨 정규화
+            if normalize_volume:
+                if target_dBFS is None:
+                    target_dBFS = self.target_db
+                audio = audio.apply_gain(target_dBFS - audio.dBFS)
+
+            # 출력 경로 설정
+            if output_path is None:
+                output_path = audio_path.parent / f"{audio_path.stem}_normalized.wav"
+
+            # 저장 (한 번)
+            audio.export(
+                str(output_path),
+                format="wav",
+                parameters=["-ar", str(self.sample_rate)]
+            )
+
+            logger.info(
+                f"무음 제거/볼륨 정규화 완료: {audio_path.name} "
+                f"({original_duration}ms -> {len(audio)}ms, 비율: {ratio:.2%})"
+            )
+
+            return output_path, ratio
+
+        except Exception as e:
+            raise AudioProcessingError(f"무음 제거/볼륨 정규화 실패: {str(e)}")
+
     @handle_errors(context="adjust_sample_rate")
     @log_execution_time
     def adjust_sample_rate(
@@ -293,23 +377,22 @@ class AudioNormalizer:
                 temp_files.append(temp_path)
                 result['steps'].append('sample_rate_adjustment')
 
-            # 2. 무음 제거
-            silence_ratio = 1.0
-            if remove_silence_flag:
-                logger.debug("무음 제거 중...")
+            # 2-3. 무음 제거 + 볼륨 정규화 (한 번의 디코딩/인코딩)
+            if remove_silence_flag or normalize_volume_flag:
+                logger.debug("무음 제거/볼륨 정규화 중...")
                 temp_path = self.file_handler.create_temp_file(suffix=".wav")
-                current_path, silence_ratio = self.remove_silence(current_path, temp_path)
+                current_path, silence_ratio = self.remove_silence_and_normalize(
+                    current_path,
+                    temp_path,
+                    remove_silence=remove_silence_flag,
+                    normalize_volume=normalize_volume_flag)
                 temp_files.append(temp_path)
-                result['steps'].append('silence_removal')
-                result['silence_ratio'] = silence_ratio
 
-            # 3. 볼륨 정규화
-            if normalize_volume_flag:
-                logger.debug("볼륨 정규화 중...")
-                temp_path = self.file_handler.create_temp_file(suffix=".wav")
-                current_path = self.normalize_volume(current_path, temp_path)
-                temp_files.append(temp_path)
-                result['steps'].append('volume_normalization')
+                if remove_silence_flag:
+                    result['steps'].append('silence_removal')
+                    result['silence_ratio'] = silence_ratio
+                if normalize_volume_flag:
+                    result['steps'].append('volume_normalization')
 
             # 최종 파일 저장
             if output_path is None:
@@ -135,6 +135,10 @@ class TonePattern(Enum):
 class KoreanTextProcessor:
     """한국어 텍스트 처리 클래스"""
 
+    # 완성형 한글 음절과 공백 이외의 문자 (음절 분리용)
+    NON_SYLLABLE_PATTERN = re.compile(r'[^가-힣 ]')
+    REPEATED_SPACE_PATTERN = re.compile(r' {2,}')
+
     def __init__(self):
         """초기화"""
         try:
@@ -249,17 +253,12 @@ class KoreanTextProcessor:
             음절 리스트
         """
         text = self.normalize_korean_text(text)
-        syllables = []
 
-        for char in text:
-            if '가' <= char <= '힣':
-                syllables.append(char)
-            elif char == ' ':
-                # 공백은 유지 (단어 경계)
-                if syllables and syllables[-1] != ' ':
-                    syllables.append(' ')
+        # 한글 음절만 남기고, 공백은 단어 경계로 하나씩만 유지
+        text = self.NON_SYLLABLE_PATTERN.sub('', text)
+        text = self.REPEATED_SPACE_PATTERN.sub(' ', text).lstrip(' ')
 
-        return syllables
+        return list(text)
 
 
 # ========== 한국어 음성 분석 ==========
@@ -333,20 +332,16 @@ class KoreanSpeechAnalyzer:
 
     def _extract_pitch_features(self, pitch) -> Dict[str, float]:
         """피치 특징 추출"""
-        pitch_values = []
-        for t in pitch.xs():
-            value = pitch.get_value_at_time(t)
-            if value and not np.isnan(value):
-                pitch_values.append(value)
+        # 프레임별 주파수를 한 번에 읽고 유성음 프레임만 사용 (무성음은 0)
+        frequencies = pitch.selected_array['frequency']
+        pitch_array = frequencies[frequencies > 0]
 
-        if not pitch_values:
+        if len(pitch_array) == 0:
             return {
                 'mean': 0.0, 'std': 0.0, 'min': 0.0, 'max': 0.0,
                 'range': 0.0, 'slope': 0.0
             }
 
-        pitch_array = np.array(pitch_values)
-
         # 선형 회귀로 기울기 계산
         x = np.arange(len(pitch_array))
         slope, _ = np.polyfit(x, pitch_array, 1) if len(pitch_array) > 1 else (0.0, 0.0)
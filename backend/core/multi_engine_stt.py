@@ -12,10 +12,12 @@ import time
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
-import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
+import threading
+from collections import Counter
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 오디오 처리
@@ -59,7 +61,7 @@ class STTEngine(Enum):
 # ========== 데이터 클래스 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class STTResult:
     """STT 결과 데이터"""
     engine: str
@@ -87,7 +89,7 @@ class STTResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiSTTResult:
     """다중 STT 통합 결과"""
     results: List[STTResult]
@@ -432,6 +434,10 @@ class NaverSTTEngine:
 class MultiEngineSTT:
     """다중 STT 엔진 통합 관리 클래스"""
 
+    # 공유 엔진 풀이 동시에 처리할 transcribe_multiple 호출 수
+    # (풀 크기 = 엔진 수 × 이 값, 조기 종료 후 남은 엔진이 다른 호출을 막지 않도록 여유 확보)
+    CONCURRENT_CALLS = 4
+
     def __init__(self,
                  engines: Optional[List[str]] = None,
                  enable_whisper: bool = True):
@@ -445,15 +451,6 @@ class MultiEngineSTT:
         self.engines = {}
         self.file_handler = file_handler
 
-        # Whisper 엔진
-        if enable_whisper:
-            try:
-                from core.advanced_stt_processor import WhisperProcessor
-                self.engines[STTEngine.WHISPER.value] = WhisperProcessor()
-                logger.info("Whisper 엔진 활성화")
-            except Exception as e:
-                logger.warning(f"Whisper 엔진 로드 실패: {e}")
-
         # 엔진 리스트가 지정되지 않으면 설정에서 가져옴
         if engines is None:
             engines = []
@@ -464,28 +461,88 @@ class MultiEngineSTT:
             if settings.ENABLE_NAVER_STT:
                 engines.append(STTEngine.NAVER.value)
 
-        # 각 엔진 초기화
-        for engine_name in engines:
-            self._initialize_engine(engine_name)
+        # Whisper 는 enable_whisper 로만 제어
+        engine_names = [e for e in engines if e != STTEngine.WHISPER.value]
+        if enable_whisper:
+            engine_names.insert(0, STTEngine.WHISPER.value)
+
+        # 각 엔진 초기화 (모델 로드와 클라우드 인증을 동시에 진행)
+        if engine_names:
+            with ThreadPoolExecutor(max_workers=len(engine_names)) as pool:
+                instances = list(pool.map(self._create_engine, engine_names))
+
+            for engine_name, instance in zip(engine_names, instances):
+                if instance is not None:
+                    self.engines[engine_name] = instance
+
+        # 장치별 동시 실행 제한 (GPU(cuda/mps)는 메모리를 공유하므로 한 번에
+        # 하나씩, CPU 와 클라우드 엔진은 제한 없음). 엔진이 보고한 CPU 외 장치도 포함
+        gated_devices = {"cuda", "mps"} | {
+            str(getattr(engine, "device", "cpu")).split(":")[0]
+            for engine in self.engines.values()
+        }
+        gated_devices.discard("cpu")
+        self._device_semaphores = {
+            device: threading.BoundedSemaphore(1)
+            for device in gated_devices
+        }
+
+        # 엔진 실행용 공유 스레드 풀 (처음 필요할 때 생성, close()에서 종료)
+        # 모델은 이 프로세스에 한 번만 로드되어 있고, Whisper(torch)와
+        # 클라우드 API 호출은 GIL 을 해제하므로 프로세스 대신 스레드 사용
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         logger.info(f"MultiEngineSTT 초기화 완료: {list(self.engines.keys())}")
 
-    def _initialize_engine(self, engine_name: str):
-        """개별 엔진 초기화"""
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """공유 엔진 풀 (지연 생성)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, len(self.engines)) *
+                    self.CONCURRENT_CALLS,
+                    thread_name_prefix="stt-engine")
+            return self._executor
+
+    def close(self):
+        """공유 엔진 풀 종료 (대기 중인 엔진 작업은 취소)"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __del__(self):
         try:
-            if engine_name == STTEngine.GOOGLE.value and GOOGLE_AVAILABLE:
-                self.engines[engine_name] = GoogleSTTEngine()
+            self.close()
+        except Exception:
+            pass
+
+    def _create_engine(self, engine_name: str):
+        """개별 엔진 생성 (실패하거나 사용할 수 없으면 None)"""
+        try:
+            if engine_name == STTEngine.WHISPER.value:
+                from core.advanced_stt_processor import WhisperProcessor
+                engine = WhisperProcessor()
+
+            elif engine_name == STTEngine.GOOGLE.value and GOOGLE_AVAILABLE:
+                engine = GoogleSTTEngine()
 
             elif engine_name == STTEngine.AZURE.value and AZURE_AVAILABLE:
-                self.engines[engine_name] = AzureSTTEngine()
+                engine = AzureSTTEngine()
 
             elif engine_name == STTEngine.NAVER.value:
-                self.engines[engine_name] = NaverSTTEngine()
+                engine = NaverSTTEngine()
+
+            else:
+                return None
 
             logger.info(f"{engine_name} 엔진 초기화 성공")
+            return engine
 
         except Exception as e:
             logger.warning(f"{engine_name} 엔진 초기화 실패: {e}")
+            return None
 
     @handle_errors(context="transcribe_single_engine")
     def transcribe_single(self,
@@ -522,7 +579,8 @@ class MultiEngineSTT:
         # 전사 실행
         if engine_name == STTEngine.WHISPER.value:
             # Whisper는 다른 인터페이스 사용
-            result = engine.transcribe(audio_path, language=language)
+            with self._device_slot(getattr(engine, "device", "cpu")):
+                result = engine.transcribe(audio_path, language=language)
             return STTResult(engine=STTEngine.WHISPER.value,
                              text=result.text,
                              confidence=result.confidence,
@@ -533,13 +591,20 @@ class MultiEngineSTT:
         else:
             return engine.transcribe(audio_path, language)
 
+    def _device_slot(self, device: str):
+        """로컬 모델 실행 장치의 동시 실행 슬롯 (제한이 없는 장치는 통과)"""
+        semaphore = self._device_semaphores.get(str(device).split(":")[0])
+        return semaphore if semaphore is not None else nullcontext()
+
     @handle_errors(context="transcribe_multiple_engines")
     @log_execution_time
     def transcribe_multiple(self,
                             audio_path: Union[str, Path],
                             engines: Optional[List[str]] = None,
                             language: Optional[str] = None,
-                            parallel: bool = True) -> MultiSTTResult:
+                            parallel: bool = True,
+                            early_stop_confidence: Optional[float] = None,
+                            min_engines: int = 2) -> MultiSTTResult:
         """
         다중 엔진으로 전사
 
@@ -548,6 +613,9 @@ class MultiEngineSTT:
             engines: 사용할 엔진 리스트 (None이면 모든 엔진)
             language: 언어 코드
             parallel: 병렬 처리 여부
+            early_stop_confidence: 병렬 처리 시 이 신뢰도 이상의 결과나 과반
+                합의가 나오면 나머지 엔진을 기다리지 않음 (None이면 비활성)
+            min_engines: 조기 종료 전에 받아야 할 최소 결과 수
 
         Returns:
             통합 STT 결과
@@ -570,14 +638,15 @@ class MultiEngineSTT:
         results = []
 
         if parallel and len(engines) > 1:
-            # 병렬 처리
-            with ThreadPoolExecutor(max_workers=len(engines)) as executor:
-                futures = {
-                    executor.submit(self.transcribe_single, audio_path, engine, language):
-                    engine
-                    for engine in engines
-                }
+            # 병렬 처리 (공유 엔진 풀 사용)
+            executor = self._get_executor()
+            futures = {
+                executor.submit(self.transcribe_single, audio_path, engine, language):
+                engine
+                for engine in engines
+            }
 
+            try:
                 for future in as_completed(futures):
                     try:
                         result = future.result(timeout=60)
@@ -592,16 +661,29 @@ class MultiEngineSTT:
                                       language=language or "unknown",
                                       processing_time=0.0,
                                       error=str(e)))
+
+                    if self._can_stop_early(results, len(engines),
+                                            early_stop_confidence, min_engines):
+                        logger.info(f"조기 종료: {len(results)}/{len(engines)} 엔진 결과 사용")
+                        break
+            finally:
+                # 이 호출에서 아직 시작되지 않은 엔진만 취소 (실행 중인 엔진은
+                # 백그라운드에서 끝나며, 풀 크기에 CONCURRENT_CALLS 만큼 여유가 있음)
+                for future in futures:
+                    future.cancel()
         else:
             # 순차 처리
             for engine in engines:
                 result = self.transcribe_single(audio_path, engine, language)
                 results.append(result)
 
-        # 결과 분석
-        best_result = self._select_best_result(results)
-        consensus_text = self._get_consensus_text(results)
-        combined_confidence = self._calculate_combined_confidence(results)
+        # 결과 분석 (성공 결과를 한 번만 걸러 신뢰도 내림차순으로 정렬)
+        valid_results = sorted((r for r in results if r.is_success),
+                               key=lambda r: r.confidence,
+                               reverse=True)
+        best_result = self._select_best_result(valid_results)
+        consensus_text = self._get_consensus_text(valid_results)
+        combined_confidence = self._calculate_combined_confidence(valid_results)
 
         return MultiSTTResult(results=results,
                               best_result=best_result,
@@ -609,20 +691,35 @@ class MultiEngineSTT:
                               combined_confidence=combined_confidence,
                               total_processing_time=time.time() - start_time)
 
-    def _select_best_result(self,
-                            results: List[STTResult]) -> Optional[STTResult]:
-        """최적 결과 선택"""
-        valid_results = [r for r in results if r.is_success]
+    def _can_stop_early(self, results: List[STTResult], total_engines: int,
+                        threshold: Optional[float], min_engines: int) -> bool:
+        """조기 종료 가능 여부 (고신뢰도 결과 또는 과반 합의)"""
+        if threshold is None or len(results) >= total_engines:
+            return False
 
+        if len(results) < min(min_engines, total_engines):
+            return False
+
+        valid_results = [r for r in results if r.is_success]
         if not valid_results:
-            return None
+            return False
+
+        if any(r.confidence >= threshold for r in valid_results):
+            return True
 
-        # 신뢰도 기준 정렬
-        return max(valid_results, key=lambda x: x.confidence)
+        # 전체 엔진 수 기준 과반이 같은 텍스트를 냈으면 결과가 바뀌지 않음
+        top_count = Counter(r.text for r in valid_results).most_common(1)[0][1]
+        return top_count > total_engines / 2
 
-    def _get_consensus_text(self, results: List[STTResult]) -> Optional[str]:
-        """합의 텍스트 도출"""
-        valid_texts = [r.text for r in results if r.is_success and r.text]
+    def _select_best_result(
+            self, valid_results: List[STTResult]) -> Optional[STTResult]:
+        """최적 결과 선택 (신뢰도 내림차순으로 정렬된 성공 결과)"""
+        return valid_results[0] if valid_results else None
+
+    def _get_consensus_text(self,
+                            valid_results: List[STTResult]) -> Optional[str]:
+        """합의 텍스트 도출 (신뢰도 내림차순으로 정렬된 성공 결과)"""
+        valid_texts = [r.text for r in valid_results]
 
         if not valid_texts:
             return None
@@ -631,7 +728,6 @@ class MultiEngineSTT:
             return valid_texts[0]
 
         # 가장 많이 나온 텍스트 선택
-        from collections import Counter
         text_counts = Counter(valid_texts)
         most_common = text_counts.most_common(1)[0]
 
@@ -640,30 +736,28 @@ class MultiEngineSTT:
             return most_common[0]
 
         # 아니면 최고 신뢰도 텍스트 반환
-        best_result = self._select_best_result(results)
-        return best_result.text if best_result else None
-
-    def _calculate_combined_confidence(self,
-                                       results: List[STTResult]) -> float:
-        """통합 신뢰도 계산"""
-        valid_results = [r for r in results if r.is_success]
+        return valid_texts[0]
 
+    def _calculate_combined_confidence(
+            self, valid_results: List[STTResult]) -> float:
+        """통합 신뢰도 계산 (성공 결과만 전달)"""
         if not valid_results:
             return 0.0
 
-        # 가중 평균 (신뢰도가 높을수록 가중치 증가)
-        total_weight = 0
-        weighted_sum = 0
+        # 가중 평균 (신뢰도 제곱을 가중치로 사용: sum(c^3) / sum(c^2))
+        total_weight = 0.0
+        weighted_sum = 0.0
 
         for result in valid_results:
-            weight = result.confidence**2  # 제곱으로 가중치
+            weight = result.confidence * result.confidence
             weighted_sum += result.confidence * weight
             total_weight += weight
 
         if total_weight > 0:
             return weighted_sum / total_weight
 
-        return np.mean([r.confidence for r in valid_results])
+        # 가중치 합이 0이면 모든 신뢰도가 0
+        return 0.0
 
     def _get_default_language(self, engine_name: str) -> str:
         """엔진별 기본 언어 코드"""
@@ -33,9 +33,18 @@ except ImportError:
 # 텍스트 처리
 from difflib import SequenceMatcher
 try:
-    import Levenshtein
+    # RapidFuzz: 비트 병렬 C++ 구현 (문자열과 단어 리스트 모두 지원)
+    from rapidfuzz.distance import Levenshtein
 except ImportError:
-    Levenshtein = None
+    try:
+        import Levenshtein
+    except ImportError:
+        Levenshtein = None
+try:
+    # 일괄 거리 계산 (구버전 rapidfuzz 에는 없으므로 개별 계산으로 폴백)
+    from rapidfuzz.process import cpdist
+except ImportError:
+    cpdist = None
 import re
 
 # 프로젝트 모듈
@@ -74,7 +83,7 @@ class QualityLevel(Enum):
 # ========== 데이터 클래스 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioQualityMetrics:
     """오디오 품질 메트릭"""
     snr: float  # Signal-to-Noise Ratio
@@ -84,6 +93,9 @@ class AudioQualityMetrics:
     peak_level: float  # 피크 레벨
     rms_level: float  # RMS 레벨
 
+    # 가중치 (SNR, THD, Clarity, DR)
+    WEIGHTS = (0.3, 0.2, 0.3, 0.2)
+
     @property
     def overall_score(self) -> float:
         """전체 품질 점수 (0-1)"""
@@ -94,10 +106,10 @@ class AudioQualityMetrics:
         dr_score = min(max(self.dynamic_range / 20, 0), 1)  # 20dB를 최대로
 
         # 가중 평균
-        weights = [0.3, 0.2, 0.3, 0.2]  # SNR, THD, Clarity, DR
-        scores = [snr_score, thd_score, clarity_score, dr_score]
+        snr_w, thd_w, clarity_w, dr_w = self.WEIGHTS
 
-        return sum(w * s for w, s in zip(weights, scores))
+        return (snr_w * snr_score + thd_w * thd_score +
+                clarity_w * clarity_score + dr_w * dr_score)
 
     def to_dict(self) -> Dict[str, float]:
         return {
@@ -111,7 +123,7 @@ class AudioQualityMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class STTAccuracyMetrics:
     """STT 정확도 메트릭"""
     wer: float  # Word Error Rate
@@ -138,7 +150,7 @@ class STTAccuracyMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PronunciationMetrics:
     """발음 평가 메트릭"""
     pitch_accuracy: float  # 피치 정확도
@@ -149,10 +161,8 @@ class PronunciationMetrics:
     @property
     def overall_score(self) -> float:
         """전체 발음 점수 (0-1)"""
-        return np.mean([
-            self.pitch_accuracy, self.timing_accuracy, self.intensity_match,
-            self.spectral_similarity
-        ])
+        return (self.pitch_accuracy + self.timing_accuracy +
+                self.intensity_match + self.spectral_similarity) / 4
 
     def to_dict(self) -> Dict[str, float]:
         return {
@@ -164,7 +174,7 @@ class PronunciationMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityValidationResult:
     """품질 검증 종합 결과"""
     audio_quality: Optional[AudioQualityMetrics] = None
@@ -379,6 +389,15 @@ class AudioQualityValidator:
 class STTAccuracyValidator:
     """STT 정확도 검증 클래스"""
 
+    # 한국어 문장 구조 판정 규칙 (조사, 어미)
+    KOREAN_PARTICLES = ('은', '는', '이', '가', '을', '를', '에', '에서', '으로', '와',
+                        '과')
+    KOREAN_ENDINGS = ('다', '요', '까', '죠', '네', '군', '구나')
+
+    # 허용 문자 패턴 (한국어는 한글 포함, 그 외는 영문, 숫자, 기본 문장부호)
+    KOREAN_CHARACTER_PATTERN = re.compile(r'^[가-힣a-zA-Z0-9\s\.\,\!\?\-]+$')
+    DEFAULT_CHARACTER_PATTERN = re.compile(r'^[a-zA-Z0-9\s\.\,\!\?\-]+$')
+
     def __init__(self):
         """초기화"""
         logger.info("STTAccuracyValidator 초기화 완료")
@@ -403,14 +422,18 @@ class STTAccuracyValidator:
         transcribed = self._normalize_text(transcribed_text)
         reference = self._normalize_text(reference_text)
 
-        # WER 계산
-        wer = self._calculate_wer(transcribed, reference)
+        if transcribed == reference:
+            # 완전히 일치하면 거리/유사도 계산 생략
+            wer, cer, similarity = 0.0, 0.0, 1.0
+        else:
+            # WER 계산
+            wer = self._calculate_wer(transcribed, reference)
 
-        # CER 계산
-        cer = self._calculate_cer(transcribed, reference)
+            # CER 계산
+            cer = self._calculate_cer(transcribed, reference)
 
-        # 유사도 계산
-        similarity = SequenceMatcher(None, transcribed, reference).ratio()
+            # 유사도 계산
+            similarity = SequenceMatcher(None, transcribed, reference).ratio()
 
         metrics = STTAccuracyMetrics(wer=wer,
                                      cer=cer,
@@ -420,6 +443,77 @@ class STTAccuracyValidator:
         logger.info(f"STT 정확도 검증 완료: {metrics.accuracy:.2%}")
         return metrics
 
+    @handle_errors(context="validate_stt_accuracy_batch")
+    def validate_accuracy_batch(
+            self,
+            transcribed_texts: List[str],
+            reference_texts: List[str],
+            confidences: Optional[List[float]] = None
+    ) -> List[STTAccuracyMetrics]:
+        """
+        STT 정확도 일괄 검증 (평가 코퍼스 등 대량 처리용)
+
+        Args:
+            transcribed_texts: 전사된 텍스트 리스트
+            reference_texts: 참조 텍스트 리스트 (같은 순서로 대응)
+            confidences: STT 신뢰도 리스트
+
+        Returns:
+            입력 순서대로의 STT 정확도 메트릭 리스트
+        """
+        if len(transcribed_texts) != len(reference_texts):
+            raise ValidationError("reference_texts",
+                                  "전사 텍스트와 참조 텍스트의 개수가 다릅니다")
+
+        if confidences is None:
+            confidences = [0.0] * len(transcribed_texts)
+
+        transcribed = [self._normalize_text(t) for t in transcribed_texts]
+        reference = [self._normalize_text(t) for t in reference_texts]
+        transcribed_words = [t.split() for t in transcribed]
+        reference_words = [t.split() for t in reference]
+
+        # 편집 거리 (RapidFuzz 가 있으면 모든 쌍을 한 번의 호출로 병렬 계산)
+        if cpdist is not None and transcribed:
+            word_distances = cpdist(transcribed_words,
+                                    reference_words,
+                                    scorer=Levenshtein.distance,
+                                    workers=-1).tolist()
+            char_distances = cpdist(transcribed,
+                                    reference,
+                                    scorer=Levenshtein.distance,
+                                    workers=-1).tolist()
+        else:
+            word_distances = [
+                Levenshtein.distance(t, r)
+                for t, r in zip(transcribed_words, reference_words)
+            ]
+            char_distances = [
+                Levenshtein.distance(t, r)
+                for t, r in zip(transcribed, reference)
+            ]
+
+        results = []
+        for i in range(len(transcribed)):
+            wer = self._error_rate(word_distances[i], len(reference_words[i]),
+                                   len(transcribed_words[i]))
+            cer = self._error_rate(char_distances[i], len(reference[i]),
+                                   len(transcribed[i]))
+            if transcribed[i] == reference[i]:
+                similarity = 1.0
+            else:
+                similarity = SequenceMatcher(None, transcribed[i],
+                                             reference[i]).ratio()
+
+            results.append(
+                STTAccuracyMetrics(wer=wer,
+                                   cer=cer,
+                                   similarity=similarity,
+                                   confidence=confidences[i]))
+
+        logger.info(f"STT 정확도 일괄 검증 완료: {len(results)}건")
+        return results
+
     def _normalize_text(self, text: str) -> str:
         """텍스트 정규화"""
         # 소문자 변환
@@ -443,9 +537,9 @@ class STTAccuracyValidator:
 
         # Levenshtein 거리 계산
         distance = Levenshtein.distance(transcribed_words, reference_words)
-        wer = distance / len(reference_words)
 
-        return min(wer, 1.0)
+        return self._error_rate(distance, len(reference_words),
+                                len(transcribed_words))
 
     def _calculate_cer(self, transcribed: str, reference: str) -> float:
         """Character Error Rate 계산"""
@@ -454,9 +548,17 @@ class STTAccuracyValidator:
 
         # 문자 단위 Levenshtein 거리
         distance = Levenshtein.distance(transcribed, reference)
-        cer = distance / len(reference)
 
-        return min(cer, 1.0)
+        return self._error_rate(distance, len(reference), len(transcribed))
+
+    @staticmethod
+    def _error_rate(distance: int, reference_length: int,
+                    transcribed_length: int) -> float:
+        """편집 거리를 오류율로 변환 (참조가 비어 있으면 전사 유무로 판정)"""
+        if reference_length == 0:
+            return 0.0 if transcribed_length == 0 else 1.0
+
+        return min(distance / reference_length, 1.0)
 
     @handle_errors(context="evaluate_transcription_quality")
     def evaluate_quality(self,
@@ -512,26 +614,19 @@ class STTAccuracyValidator:
     def _has_valid_characters(self, text: str, language: str) -> bool:
         """유효한 문자 확인"""
         if language == "ko":
-            # 한글, 영문, 숫자, 기본 문장부호만 허용
-            pattern = r'^[가-힣a-zA-Z0-9\s\.\,\!\?\-]+$'
+            pattern = self.KOREAN_CHARACTER_PATTERN
         else:
-            # 영문, 숫자, 기본 문장부호
-            pattern = r'^[a-zA-Z0-9\s\.\,\!\?\-]+$'
+            pattern = self.DEFAULT_CHARACTER_PATTERN
 
-        return bool(re.match(pattern, text))
+        return bool(pattern.match(text))
 
     def _check_sentence_structure(self, text: str, language: str) -> bool:
         """문장 구조 확인"""
         if language == "ko":
             # 한국어: 최소한 주어나 동사가 있어야 함
             # 간단한 휴리스틱: 조사나 어미 확인
-            particles = [
-                '은', '는', '이', '가', '을', '를', '에', '에서', '으로', '와', '과'
-            ]
-            endings = ['다', '요', '까', '죠', '네', '군', '구나']
-
-            has_particle = any(p in text for p in particles)
-            has_ending = any(text.endswith(e) for e in endings)
+            has_particle = any(p in text for p in self.KOREAN_PARTICLES)
+            has_ending = text.endswith(self.KOREAN_ENDINGS)
 
             return has_particle or has_ending
         else:
@@ -836,7 +931,7 @@ class QualityValidator:
             scores.append(result.pronunciation.overall_score)
 
         if scores:
-            overall_score = np.mean(scores)
+            overall_score = sum(scores) / len(scores)
             result.overall_quality = QualityLevel.from_score(overall_score)
 
         # 권장사항 정리
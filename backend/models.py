@@ -7,12 +7,17 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 import json
 import enum
+import threading
+from contextvars import ContextVar, Token
 from pathlib import Path
 
 from sqlalchemy import (create_engine, Column, Integer, String, Float,
-                        DateTime, Boolean, Text, JSON, ForeignKey, Enum, Index)
+                        DateTime, Boolean, Text, JSON, ForeignKey, Enum, Index,
+                        select, bindparam, lambda_stmt)
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.orm import sessionmaker, scoped_session, Session, relationship
 from sqlalchemy.sql import func
 
 from config import settings
@@ -23,12 +28,48 @@ logger = get_logger(__name__)
 # ========== 데이터베이스 설정 ==========
 
 Base = declarative_base()
-engine = create_engine(settings.DATABASE_URL,
-                       echo=settings.DEBUG,
-                       pool_pre_ping=True,
-                       pool_size=5,
-                       max_overflow=10)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _engine_options() -> Dict[str, Any]:
+    """엔진 생성 옵션 (드라이버별 배치 실행 설정 포함)"""
+    options = {
+        'echo': settings.DEBUG,
+        'pool_pre_ping': True,
+        'pool_size': 5,
+        'max_overflow': 10
+    }
+
+    # psycopg2: INSERT 는 다중 VALUES, UPDATE/DELETE 는 execute_batch 로 묶음
+    if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2":
+        options.update(executemany_mode='values_plus_batch',
+                       insertmanyvalues_page_size=1000,
+                       executemany_batch_page_size=500)
+
+    return options
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options())
+
+# 요청 단위 세션 스코프: 요청 중에는 요청 토큰, 그 외에는 스레드 단위
+_db_scope: ContextVar[Optional[object]] = ContextVar("db_scope", default=None)
+
+
+def _current_db_scope():
+    scope = _db_scope.get()
+    return scope if scope is not None else threading.get_ident()
+
+
+SessionLocal = scoped_session(sessionmaker(autocommit=False,
+                                           autoflush=False,
+                                           bind=engine),
+                              scopefunc=_current_db_scope)
+
+# PostgreSQL 에서는 JSONB 로 저장 (바이너리 포맷, 재인코딩 없음)
+# 현재 audio_files.file_metadata 에만 사용. 이 변경 이전에 생성된 기존
+# PostgreSQL 데이터베이스는 컬럼이 json 으로 남아 있으므로 직접 변환 필요:
+#   ALTER TABLE audio_files
+#       ALTER COLUMN file_metadata TYPE jsonb USING file_metadata::jsonb;
+JSONType = JSON().with_variant(JSONB(none_as_null=True), "postgresql")
 
 # ========== 열거형 정의 ==========
 
@@ -95,7 +136,7 @@ class AudioFile(Base, TimestampMixin):
                                       cascade="all, delete-orphan")
 
     # 메타데이터
-    file_metadata = Column(JSON, default={})
+    file_metadata = Column(JSONType, default=dict)
 
     # 인덱스
     __table_args__ = (
@@ -159,7 +200,7 @@ class ProcessingResult(Base, TimestampMixin):
     pronunciation_score = Column(Float)
 
     # 전체 결과 JSON
-    result_data = Column(JSON, default={})
+    result_data = Column(JSON, default=dict)
     error_message = Column(Text)
 
     # 인덱스
@@ -238,7 +279,7 @@ class UserProfile(Base, TimestampMixin):
     last_session_date = Column(DateTime(timezone=True))
 
     # 설정
-    preferences = Column(JSON, default={})
+    preferences = Column(JSON, default=dict)
 
     # 관계
     audio_files = relationship("AudioFile",
@@ -318,8 +359,8 @@ class LearningSession(Base, TimestampMixin):
     fluency_score = Column(Float)
 
     # 상세 결과
-    results = Column(JSON, default={})
-    feedback = Column(JSON, default=[])
+    results = Column(JSON, default=dict)
+    feedback = Column(JSON, default=list)
 
     # 완료 여부
     is_completed = Column(Boolean, default=False)
@@ -376,9 +417,7 @@ class SystemLog(Base):
     __tablename__ = "system_logs"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime(timezone=True),
-                       server_default=func.now(),
-                       index=True)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now())
     level = Column(String(20))  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     logger_name = Column(String(100))
     message = Column(Text)
@@ -389,17 +428,44 @@ class SystemLog(Base):
     request_id = Column(String(100))
 
     # 상세 데이터
-    extra_data = Column(JSON, default={})
+    extra_data = Column(JSON, default=dict)
     traceback = Column(Text)
 
-    # 인덱스
+    # 인덱스 (append-only 테이블이므로 timestamp 는 BRIN, PostgreSQL 외에는 일반 인덱스)
+    # create_all 은 기존 테이블을 변경하지 않으므로, 이 변경 이전에 생성된
+    # 데이터베이스에는 직접 적용 필요 (PostgreSQL):
+    #   DROP INDEX IF EXISTS ix_system_logs_timestamp;
+    #   CREATE INDEX idx_logs_timestamp_brin ON system_logs
+    #       USING brin (timestamp) WITH (pages_per_range = 32);
+    # (그 외 DB: CREATE INDEX idx_logs_timestamp_brin ON system_logs (timestamp);)
     __table_args__ = (
+        Index('idx_logs_timestamp_brin',
+              'timestamp',
+              postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
         Index('idx_logs_timestamp_level', 'timestamp', 'level'),
         Index('idx_logs_user', 'user_id'),
         Index('idx_logs_session', 'session_id'),
     )
 
 
+# ========== 자주 쓰는 쿼리 (컴파일 결과 캐시) ==========
+
+_GET_USER_BY_USER_ID = lambda_stmt(lambda: select(UserProfile).where(
+    UserProfile.user_id == bindparam('uid')))
+_GET_USER_BY_ID = lambda_stmt(
+    lambda: select(UserProfile).where(UserProfile.id == bindparam('id')))
+_GET_USER_SESSIONS = lambda_stmt(lambda: select(LearningSession).where(
+    LearningSession.user_id == bindparam('user_id')))
+
+
+def _find_user(db: Session, user_id: str) -> Optional[UserProfile]:
+    """user_id 로 사용자 조회"""
+    return db.execute(_GET_USER_BY_USER_ID, {
+        'uid': user_id
+    }).scalar_one_or_none()
+
+
 # ========== 데이터베이스 유틸리티 ==========
 
 
@@ -414,8 +480,7 @@ def init_db():
         db = SessionLocal()
         try:
             # 기본 사용자 생성 (없으면)
-            guest_user = db.query(UserProfile).filter_by(
-                user_id="guest").first()
+            guest_user = _find_user(db, "guest")
             if not guest_user:
                 guest_user = UserProfile(user_id="guest",
                                          name="Guest User",
@@ -431,27 +496,74 @@ def init_db():
         raise
 
 
+def begin_db_scope() -> Token:
+    """요청 단위 DB 세션 스코프 시작 (미들웨어에서 호출)"""
+    return _db_scope.set(object())
+
+
+def end_db_scope(token: Token):
+    """요청 단위 DB 세션 스코프 종료 및 세션 반환"""
+    try:
+        SessionLocal.remove()
+    finally:
+        _db_scope.reset(token)
+
+
 def get_db() -> Session:
-    """데이터베이스 세션 생성"""
+    """데이터베이스 세션 생성
+
+    요청 스코프 안에서는 같은 요청의 모든 호출이 하나의 세션(연결)을
+    공유하며, 정리는 end_db_scope 가 담당합니다.
+    """
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        if _db_scope.get() is None:
+            SessionLocal.remove()
 
 
-def get_or_create_user(db: Session, user_id: str, **kwargs) -> UserProfile:
-    """사용자 가져오기 또는 생성"""
-    user = db.query(UserProfile).filter_by(user_id=user_id).first()
+def _dialect_insert(db: Session):
+    """ON CONFLICT 를 지원하는 방언별 insert 생성자 (미지원 방언은 None)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
 
-    if not user:
-        user = UserProfile(user_id=user_id, **kwargs)
-        db.add(user)
+
+def get_or_create_user(db: Session, user_id: str, **kwargs) -> UserProfile:
+    """사용자 가져오기 또는 생성
+
+    INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 생성하고,
+    이미 존재하면(충돌) 그때만 SELECT 합니다. 동시 요청이 같은 user_id 로
+    들어와도 IntegrityError 가 발생하지 않습니다.
+    """
+    insert = _dialect_insert(db)
+
+    if insert is None:
+        user = _find_user(db, user_id)
+        if not user:
+            user = UserProfile(user_id=user_id, **kwargs)
+            db.add(user)
+            db.commit()
+            logger.info(f"새 사용자 생성: {user_id}")
+        return user
+
+    stmt = (insert(UserProfile).values(
+        user_id=user_id, **kwargs).on_conflict_do_nothing(
+            index_elements=['user_id']).returning(UserProfile))
+    user = db.scalars(stmt).first()
+
+    if user is not None:
         db.commit()
-        db.refresh(user)
         logger.info(f"새 사용자 생성: {user_id}")
+        return user
 
-    return user
+    return _find_user(db, user_id)
 
 
 def save_audio_file(db: Session,
@@ -465,18 +577,22 @@ def save_audio_file(db: Session,
                            original_name=original_name,
                            file_path=file_path,
                            user_id=user_id,
-                           file_file_metadata=metadata)
+                           file_metadata=metadata)
 
     # 파일 정보 추출
     if Path(file_path).exists():
         import librosa
+        import soundfile as sf
         try:
-            y, sr = librosa.load(file_path, sr=None, duration=1)
-            audio_file.sample_rate = sr
-
-            # 전체 길이는 따로 계산
-            info = librosa.get_duration(filename=file_path)
-            audio_file.duration = info
+            # 헤더만 읽어 샘플레이트와 길이 추출 (오디오 디코딩 없음)
+            try:
+                info = sf.info(file_path)
+                audio_file.sample_rate = info.samplerate
+                audio_file.duration = info.duration
+            except RuntimeError:
+                # soundfile 이 읽지 못하는 컨테이너 (mp3, webm 등)
+                audio_file.sample_rate = librosa.get_samplerate(file_path)
+                audio_file.duration = librosa.get_duration(path=file_path)
 
             # 파일 크기
             audio_file.file_size = Path(file_path).stat().st_size
@@ -564,13 +680,15 @@ def cleanup_old_files(db: Session, days: int = 7):
 
 def get_user_statistics(db: Session, user_id: int) -> Dict[str, Any]:
     """사용자 통계 조회"""
-    user = db.query(UserProfile).filter_by(id=user_id).first()
+    user = db.execute(_GET_USER_BY_ID, {'id': user_id}).scalar_one_or_none()
 
     if not user:
         return {}
 
     # 세션 통계
-    sessions = db.query(LearningSession).filter_by(user_id=user_id).all()
+    sessions = db.execute(_GET_USER_SESSIONS, {
+        'user_id': user_id
+    }).scalars().all()
     completed_sessions = [s for s in sessions if s.is_completed]
 
     # 평균 점수 계산
@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+backend 디렉토리를 import 경로에 추가 (서버와 같은 방식으로 config/utils/core 사용)
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
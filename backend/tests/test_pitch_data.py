@@ -0,0 +1,60 @@
+"""
+PitchData 파생 상태 테스트
+points 재할당 시 시간 배열/통계/to_dict 결과가 함께 갱신되는지 확인
+"""
+
+import dataclasses
+
+from tonebridge_core.models import PitchData, PitchPoint
+
+
+def _make_pitch_data() -> PitchData:
+    return PitchData(points=[
+        PitchPoint(time=0.00, frequency=100.0, strength=0.9),
+        PitchPoint(time=0.01, frequency=120.0, strength=0.9),
+        PitchPoint(time=0.02, frequency=140.0, strength=0.9),
+        PitchPoint(time=0.03, frequency=160.0, strength=0.9),
+    ],
+                     time_step=0.01,
+                     min_pitch=75.0,
+                     max_pitch=600.0)
+
+
+def test_reassigning_points_refreshes_derived_state():
+    pitch_data = _make_pitch_data()
+    assert pitch_data.to_dict()['pitch_range'] == 60.0
+
+    pitch_data.points = [
+        PitchPoint(time=0.00, frequency=200.0, strength=0.8),
+        PitchPoint(time=0.01, frequency=210.0, strength=0.8),
+    ]
+
+    # 더 짧은 리스트로 바꿔도 이전 시간 배열로 인덱싱하지 않음
+    assert pitch_data.get_pitch_at_time(0.03) is None
+    assert pitch_data.get_pitch_at_time(0.01) == 210.0
+    assert pitch_data.mean_pitch == 205.0
+    assert pitch_data.pitch_range == 10.0
+
+    result = pitch_data.to_dict()
+    assert len(result['points']) == 2
+    assert result['mean_pitch'] == 205.0
+    assert result['pitch_range'] == 10.0
+
+
+def test_reassigning_unvoiced_points_clears_statistics():
+    pitch_data = _make_pitch_data()
+
+    pitch_data.points = [PitchPoint(time=0.0, frequency=0.0, strength=0.0)]
+
+    assert pitch_data.mean_pitch is None
+    assert pitch_data.std_pitch is None
+    assert pitch_data.pitch_range == 0.0
+
+
+def test_internal_state_is_not_a_dataclass_field():
+    pitch_data = _make_pitch_data()
+
+    field_names = {f.name for f in dataclasses.fields(pitch_data)}
+    assert not any(name.startswith('_') for name in field_names)
+    assert not any(key.startswith('_')
+                   for key in dataclasses.asdict(pitch_data))
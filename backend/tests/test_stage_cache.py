@@ -0,0 +1,63 @@
+"""
+StageCache 정리 테스트
+만료되었거나 다시 읽히지 않는 항목이 회수되는지 확인
+"""
+
+import os
+import time
+
+from config import settings
+from tonebridge_core.pipeline.stage_cache import StageCache
+
+
+def _age(cache: StageCache, cache_key: str, seconds: float):
+    """캐시 파일 저장 시각을 seconds 초 전으로 변경"""
+    cache_file = cache.cache_dir / f"{cache_key}.pkl"
+    past = time.time() - seconds
+    os.utime(cache_file, (past, past))
+
+
+def test_sweep_removes_expired_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_TTL', 60)
+    cache = StageCache(cache_dir=tmp_path, size_limit=10**9)
+
+    cache.set("aaaa/analysis_1", {'value': 1})
+    cache.set("bbbb/analysis_1", {'value': 2})
+    _age(cache, "aaaa/analysis_1", 120)
+
+    assert cache.sweep() == 1
+    assert not (tmp_path / "aaaa").exists()
+    assert cache.get("bbbb/analysis_1") == {'value': 2}
+
+
+def test_sweep_trims_oldest_entries_to_size_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_TTL', 3600)
+    cache = StageCache(cache_dir=tmp_path)
+
+    keys = [f"{i:04d}/segmentation_1" for i in range(3)]
+    for age, key in zip((30, 20, 10), keys):
+        cache.set(key, {'payload': 'x' * 1000})
+        _age(cache, key, age)
+
+    entry_size = (tmp_path / f"{keys[0]}.pkl").stat().st_size
+    cache.size_limit = entry_size * 2
+
+    assert cache.sweep() == 1
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_set_sweeps_unread_entries_periodically(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_TTL', 60)
+    monkeypatch.setattr(StageCache, 'SWEEP_INTERVAL', 2)
+    cache = StageCache(cache_dir=tmp_path, size_limit=10**9)
+
+    cache.set("aaaa/transcription_1", {'transcription': 'old'})
+    _age(cache, "aaaa/transcription_1", 120)
+
+    # 만료된 항목을 다시 읽지 않아도 다음 정리 주기에 삭제됨
+    cache.set("bbbb/transcription_1", {'transcription': 'new'})
+
+    assert not (tmp_path / "aaaa" / "transcription_1.pkl").exists()
+    assert (tmp_path / "bbbb" / "transcription_1.pkl").exists()
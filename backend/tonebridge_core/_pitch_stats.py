@@ -0,0 +1,52 @@
+"""
+피치 통계 커널
+유성음(주파수 > 0) 프레임의 평균, 표준편차, 범위를 한 번의 순회로 계산
+"""
+
+import numpy as np
+
+# Optional numba import (없으면 NumPy 구현 사용)
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
+
+def _voiced_stats_kernel(frequencies):
+    """Welford 온라인 알고리즘 기반 단일 패스 통계 (count, mean, std, range)"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    low = np.inf
+    high = -np.inf
+    for value in frequencies:
+        if value > 0.0:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+
+    if count == 0:
+        return 0, 0.0, 0.0, 0.0
+    return count, mean, (m2 / count)**0.5, high - low
+
+
+def _voiced_stats_numpy(frequencies):
+    """NumPy 기반 통계 (numba 미설치 시)"""
+    voiced = frequencies[frequencies > 0]
+    if voiced.size == 0:
+        return 0, 0.0, 0.0, 0.0
+    return (int(voiced.size), float(voiced.mean()), float(voiced.std()),
+            float(voiced.max() - voiced.min()))
+
+
+if HAS_NUMBA:
+    voiced_stats = njit(cache=True)(_voiced_stats_kernel)
+else:
+    voiced_stats = _voiced_stats_numpy
@@ -11,6 +11,10 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Tuple
 import numpy as np
 from dataclasses import dataclass
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+import threading
+import base64
 import json
 
 # 오디오 처리
@@ -25,16 +29,23 @@ except ImportError:
     parselmouth = None
     call = None
     HAS_PARSELMOUTH = False
+# Optional joblib import (피치 분석 결과 디스크 캐시)
+try:
+    from joblib import Memory
+    HAS_JOBLIB = True
+except ImportError:
+    Memory = None
+    HAS_JOBLIB = False
 try:
     from scipy import signal, stats
-    from scipy.interpolate import interp1d
+    from scipy.ndimage import median_filter
 except ImportError:
-    signal = stats = interp1d = None
+    signal = stats = median_filter = None
 
 # 프로젝트 모듈
 from config import settings
 from utils import get_logger, log_execution_time, handle_errors
-from tonebridge_core.models import (PitchData, PitchPoint, FormantData,
+from tonebridge_core.models import (PitchData, PitchTrack, FormantData,
                                     SpectralFeatures, Gender, TimeInterval)
 
 logger = get_logger(__name__)
@@ -74,6 +85,16 @@ class PitchAnalysisConfig:
 # ========== 결과 클래스 ==========
 
 
+def _encode_array(array: np.ndarray) -> Dict[str, Any]:
+    """배열을 float32 바이트의 base64 문자열로 인코딩 (Python 리스트 박싱 회피)"""
+    packed = np.ascontiguousarray(array, dtype=np.float32)
+    return {
+        'dtype': 'float32',
+        'shape': list(packed.shape),
+        'data': base64.b64encode(packed.tobytes()).decode('ascii')
+    }
+
+
 @dataclass
 class PitchStatistics:
     """피치 통계"""
@@ -111,7 +132,6 @@ class PitchContour:
 
     def get_smoothed(self, window_size: int = 5) -> np.ndarray:
         """스무딩된 피치 컨투어"""
-        from scipy.ndimage import median_filter
         return median_filter(self.frequencies, size=window_size)
 
     def get_interpolated(self, new_times: np.ndarray) -> np.ndarray:
@@ -121,19 +141,25 @@ class PitchContour:
         if not np.any(voiced_indices):
             return np.zeros_like(new_times)
 
-        f = interp1d(self.times[voiced_indices],
-                     self.frequencies[voiced_indices],
-                     kind='linear',
-                     bounds_error=False,
-                     fill_value=0.0)
-        return f(new_times)
+        return np.interp(new_times,
+                         self.times[voiced_indices],
+                         self.frequencies[voiced_indices],
+                         left=0.0,
+                         right=0.0)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, binary: bool = False) -> Dict[str, Any]:
+        """
+        딕셔너리 변환
+
+        Args:
+            binary: True면 배열을 base64 인코딩된 float32 바이트로 반환
+        """
+        encode = _encode_array if binary else np.ndarray.tolist
         return {
-            'times': self.times.tolist(),
-            'frequencies': self.frequencies.tolist(),
-            'strengths': self.strengths.tolist(),
-            'voiced_frames': self.voiced_frames.tolist()
+            'times': encode(self.times),
+            'frequencies': encode(self.frequencies),
+            'strengths': encode(self.strengths),
+            'voiced_frames': encode(self.voiced_frames)
         }
 
 
@@ -148,10 +174,10 @@ class PitchAnalysisResult:
     shimmer: float  # 쉬머 (amplitude perturbation)
     hnr: float  # Harmonics-to-Noise Ratio
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, binary: bool = False) -> Dict[str, Any]:
         return {
             'pitch_data': self.pitch_data.to_dict(),
-            'contour': self.contour.to_dict(),
+            'contour': self.contour.to_dict(binary=binary),
             'statistics': self.statistics.to_dict(),
             'gender_estimate': self.gender_estimate.value,
             'jitter': self.jitter,
@@ -166,14 +192,40 @@ class PitchAnalysisResult:
 class PitchAnalyzer:
     """고급 피치 분석기"""
 
-    def __init__(self, config: Optional[PitchAnalysisConfig] = None):
+    # DTW 비교 시 시퀀스당 최대 포인트 수 (PAA 축소)
+    DTW_MAX_POINTS = 200
+
+    # 성별 추정 경계 (한국어 화자 기준): <140 남성, <200 여성, <300 아동,
+    # 그 이상의 높은 피치는 일반적으로 여성
+    GENDER_THRESHOLDS = np.array([140.0, 200.0, 300.0])
+    GENDER_LABELS = (Gender.MALE, Gender.FEMALE, Gender.CHILD, Gender.FEMALE)
+
+    # 디스크 캐시 정리 주기 (캐시를 거친 분석 호출 수)
+    CACHE_SWEEP_INTERVAL = 100
+
+    def __init__(self,
+                 config: Optional[PitchAnalysisConfig] = None,
+                 sweep_cache: bool = True):
         """
         초기화
 
         Args:
             config: 피치 분석 설정
+            sweep_cache: 디스크 캐시 정리 담당 여부 (프로세스 풀 워커는 False)
         """
         self.config = config or PitchAnalysisConfig()
+
+        # 디스크 캐시: (경로, mtime, 크기, 설정, 시간 범위)를 키로 결과 저장
+        # (CACHE_TTL 보다 오래되었거나 PITCH_CACHE_SIZE_LIMIT 를 넘는 항목은
+        # 프로세스 전체에서 CACHE_SWEEP_INTERVAL 호출마다 정리)
+        self._memory = None
+        self._analyze_cached = None
+        self._sweep_enabled = sweep_cache
+        if settings.ENABLE_CACHE and HAS_JOBLIB:
+            self._memory = Memory(settings.CACHE_DIR / "pitch", verbose=0)
+            self._analyze_cached = self._memory.cache(_analyze_pitch_cached,
+                                                      ignore=['analyzer'])
+
         logger.info(
             f"PitchAnalyzer 초기화: {self.config.pitch_floor}-{self.config.pitch_ceiling}Hz"
         )
@@ -196,6 +248,46 @@ class PitchAnalyzer:
         """
         audio_path = Path(audio_path)
 
+        if self._analyze_cached is not None:
+            self._count_cache_calls()
+
+            stat = audio_path.stat()
+            return self._analyze_cached(self, self.config,
+                                        str(audio_path.resolve()),
+                                        stat.st_mtime_ns, stat.st_size,
+                                        time_range)
+
+        return self._analyze_impl(audio_path, time_range)
+
+    def _count_cache_calls(self, count: int = 1):
+        """캐시 호출 수 누적, CACHE_SWEEP_INTERVAL 경계를 넘으면 캐시 정리"""
+        global _cache_call_count
+        if self._memory is None or not self._sweep_enabled:
+            return
+
+        with _cache_call_lock:
+            before = _cache_call_count
+            _cache_call_count += count
+            due = (before // self.CACHE_SWEEP_INTERVAL !=
+                   _cache_call_count // self.CACHE_SWEEP_INTERVAL)
+
+        if due:
+            self._sweep_cache()
+
+    def _sweep_cache(self):
+        """만료되었거나 크기 제한을 넘는 디스크 캐시 항목 삭제"""
+        try:
+            self._memory.reduce_size(
+                bytes_limit=settings.PITCH_CACHE_SIZE_LIMIT,
+                age_limit=timedelta(seconds=settings.CACHE_TTL))
+        except Exception as e:
+            logger.warning(f"피치 캐시 정리 실패: {e}")
+
+    def _analyze_impl(
+            self,
+            audio_path: Path,
+            time_range: Optional[TimeInterval] = None) -> PitchAnalysisResult:
+        """캐시를 거치지 않는 실제 피치 분석"""
         # Parselmouth로 로드
         sound = parselmouth.Sound(str(audio_path))
 
@@ -214,25 +306,25 @@ class PitchAnalyzer:
         # 통계 계산
         statistics = self._calculate_statistics(contour)
 
-        # PitchData 생성
-        pitch_points = []
-        for t, f, s in zip(contour.times, contour.frequencies,
-                           contour.strengths):
-            if f > 0:  # 유성음만
-                pitch_points.append(PitchPoint(time=t, frequency=f,
-                                               strength=s))
+        # PitchData 생성 (유성음만)
+        voiced = contour.frequencies > 0
+        track = PitchTrack(times=contour.times[voiced],
+                           frequencies=contour.frequencies[voiced],
+                           strengths=contour.strengths[voiced])
 
-        pitch_data = PitchData(points=pitch_points,
+        pitch_data = PitchData(points=track.to_points(),
                                time_step=self.config.time_step,
                                min_pitch=self.config.pitch_floor,
-                               max_pitch=self.config.pitch_ceiling)
+                               max_pitch=self.config.pitch_ceiling,
+                               track=track)
 
         # 성별 추정
         gender_estimate = self._estimate_gender(statistics)
 
-        # 음성 품질 메트릭 계산
-        jitter = self._calculate_jitter(sound)
-        shimmer = self._calculate_shimmer(sound)
+        # 음성 품질 메트릭 계산 (지터와 쉬머는 같은 PointProcess 공유)
+        point_process = self._create_point_process(sound)
+        jitter = self._calculate_jitter(point_process)
+        shimmer = self._calculate_shimmer(sound, point_process)
         hnr = self._calculate_hnr(sound)
 
         return PitchAnalysisResult(pitch_data=pitch_data,
@@ -259,28 +351,18 @@ class PitchAnalyzer:
 
     def _create_contour(self, pitch) -> PitchContour:
         """피치 컨투어 생성"""
-        times = pitch.xs()
-        frequencies = []
-        strengths = []
-        voiced_frames = []
-
-        for t in times:
-            f = pitch.get_value_at_time(t)
-            s = pitch.get_strength_at_time(t)
-
-            if f is not None and not np.isnan(f):
-                frequencies.append(f)
-                strengths.append(s if s is not None else 0.0)
-                voiced_frames.append(1.0)
-            else:
-                frequencies.append(0.0)
-                strengths.append(0.0)
-                voiced_frames.append(0.0)
-
-        return PitchContour(times=np.array(times),
-                            frequencies=np.array(frequencies),
-                            strengths=np.array(strengths),
-                            voiced_frames=np.array(voiced_frames))
+        # 프레임별 선택 후보를 한 번에 읽음 (무성음 프레임은 주파수 0)
+        selected = pitch.selected_array
+        frequencies = np.nan_to_num(selected['frequency'])
+        voiced = frequencies > 0
+
+        # 피치/강도 값은 float32로 충분 (시간축은 프레임 시각 정밀도 유지)
+        return PitchContour(
+            times=np.asarray(pitch.xs()),
+            frequencies=np.where(voiced, frequencies, 0.0).astype(np.float32),
+            strengths=np.where(voiced, np.nan_to_num(selected['strength']),
+                               0.0).astype(np.float32),
+            voiced_frames=voiced.astype(np.float32))
 
     def _calculate_statistics(self, contour: PitchContour) -> PitchStatistics:
         """피치 통계 계산"""
@@ -298,18 +380,23 @@ class PitchAnalyzer:
                                    q75=0.0,
                                    iqr=0.0)
 
-        return PitchStatistics(
-            mean=float(np.mean(voiced_freqs)),
-            median=float(np.median(voiced_freqs)),
-            std=float(np.std(voiced_freqs)),
-            min=float(np.min(voiced_freqs)),
-            max=float(np.max(voiced_freqs)),
-            range=float(np.max(voiced_freqs) - np.min(voiced_freqs)),
-            q25=float(np.percentile(voiced_freqs, 25)),
-            q75=float(np.percentile(voiced_freqs, 75)),
-            iqr=float(
-                np.percentile(voiced_freqs, 75) -
-                np.percentile(voiced_freqs, 25)))
+        # 한 번 정렬하여 최소/최대는 양 끝에서, 사분위수와 중앙값은 한 번의
+        # percentile 호출로 계산
+        sorted_freqs = np.sort(voiced_freqs)
+        min_freq = float(sorted_freqs[0])
+        max_freq = float(sorted_freqs[-1])
+        q25, median, q75 = (float(q)
+                            for q in np.percentile(sorted_freqs, [25, 50, 75]))
+
+        return PitchStatistics(mean=float(sorted_freqs.mean()),
+                               median=median,
+                               std=float(sorted_freqs.std()),
+                               min=min_freq,
+                               max=max_freq,
+                               range=max_freq - min_freq,
+                               q25=q25,
+                               q75=q75,
+                               iqr=q75 - q25)
 
     def _estimate_gender(self, statistics: PitchStatistics) -> Gender:
         """성별 추정"""
@@ -318,34 +405,36 @@ class PitchAnalyzer:
         if mean_pitch == 0:
             return Gender.UNKNOWN
 
-        # 한국어 화자 기준
-        if mean_pitch < 140:  # 남성
-            return Gender.MALE
-        elif mean_pitch < 200:  # 여성
-            return Gender.FEMALE
-        elif mean_pitch < 300:  # 아동
-            return Gender.CHILD
-        else:
-            return Gender.FEMALE  # 높은 피치는 일반적으로 여성
+        index = np.searchsorted(self.GENDER_THRESHOLDS, mean_pitch, side='right')
+        return self.GENDER_LABELS[index]
 
-    def _calculate_jitter(self, sound: "parselmouth.Sound") -> float:
+    def _create_point_process(self, sound: "parselmouth.Sound"):
+        """성문 주기 PointProcess 생성 (실패 시 None)"""
+        try:
+            return call(sound, "To PointProcess (periodic, cc)",
+                        self.config.pitch_floor, self.config.pitch_ceiling)
+        except:
+            return None
+
+    def _calculate_jitter(self, point_process) -> float:
         """지터 계산 (pitch perturbation)"""
+        if point_process is None:
+            return 0.0
+
         try:
-            point_process = call(sound, "To PointProcess (periodic, cc)",
-                                 self.config.pitch_floor,
-                                 self.config.pitch_ceiling)
             jitter = call(point_process, "Get jitter (local)", 0, 0, 0.0001,
                           0.02, 1.3)
             return float(jitter * 100) if jitter else 0.0  # 퍼센트로 변환
         except:
             return 0.0
 
-    def _calculate_shimmer(self, sound: "parselmouth.Sound") -> float:
+    def _calculate_shimmer(self, sound: "parselmouth.Sound",
+                           point_process) -> float:
         """쉬머 계산 (amplitude perturbation)"""
+        if point_process is None:
+            return 0.0
+
         try:
-            point_process = call(sound, "To PointProcess (periodic, cc)",
-                                 self.config.pitch_floor,
-                                 self.config.pitch_ceiling)
             shimmer = call([sound, point_process], "Get shimmer (local)", 0, 0,
                            0.0001, 0.02, 1.3, 1.6)
             return float(shimmer * 100) if shimmer else 0.0  # 퍼센트로 변환
@@ -362,6 +451,34 @@ class PitchAnalyzer:
         except:
             return 0.0
 
+    @handle_errors(context="analyze_pitch_batch")
+    def analyze_many(
+            self,
+            audio_paths: List[Union[str, Path]],
+            max_workers: Optional[int] = None) -> List[PitchAnalysisResult]:
+        """
+        여러 파일 피치 분석 (파일별로 독립적이므로 프로세스 풀에서 병렬 실행)
+
+        Args:
+            audio_paths: 오디오 파일 경로 리스트
+            max_workers: 워커 프로세스 수 (None이면 설정값)
+
+        Returns:
+            입력 순서대로의 피치 분석 결과
+        """
+        if len(audio_paths) <= 1:
+            return [self.analyze(audio_path) for audio_path in audio_paths]
+
+        # 워커마다 분석기를 한 번만 생성 (캐시 정리는 이 프로세스가 담당)
+        with ProcessPoolExecutor(
+                max_workers=max_workers or settings.MAX_WORKERS,
+                initializer=_init_pitch_worker,
+                initargs=(self.config, )) as executor:
+            results = list(executor.map(_analyze_pitch_in_worker, audio_paths))
+
+        self._count_cache_calls(len(audio_paths))
+        return results
+
     @handle_errors(context="compare_pitch")
     def compare(self, audio1: Union[str, Path],
                 audio2: Union[str, Path]) -> Dict[str, Any]:
@@ -375,12 +492,14 @@ class PitchAnalyzer:
         Returns:
             비교 결과
         """
-        # 각각 분석
+        # 각각 분석 (같은 파일이면 한 번만)
         result1 = self.analyze(audio1)
-        result2 = self.analyze(audio2)
+        if Path(audio1).resolve() == Path(audio2).resolve():
+            result2 = result1
+        else:
+            result2 = self.analyze(audio2)
 
         # DTW (Dynamic Time Warping) 거리 계산
-        from scipy.spatial.distance import euclidean
         from fastdtw import fastdtw
 
         # 유성음 프레임만 사용
@@ -388,7 +507,12 @@ class PitchAnalyzer:
         freq2 = result2.contour.frequencies[result2.contour.voiced_frames > 0]
 
         if len(freq1) > 0 and len(freq2) > 0:
-            distance, path = fastdtw(freq1, freq2, dist=euclidean)
+            # PAA로 축소한 뒤 DTW (1차원이므로 기본 절대차 거리 사용)
+            reduced1 = self._paa(freq1, self.DTW_MAX_POINTS)
+            reduced2 = self._paa(freq2, self.DTW_MAX_POINTS)
+            distance, _ = fastdtw(reduced1, reduced2)
+            # 축소 비율만큼 원래 시퀀스 길이 기준으로 환산
+            distance *= max(len(freq1), len(freq2)) / max(len(reduced1), len(reduced2))
             similarity = 1.0 / (1.0 + distance / max(len(freq1), len(freq2)))
         else:
             distance = float('inf')
@@ -409,6 +533,41 @@ class PitchAnalyzer:
             'statistics_difference': stat_diff
         }
 
+    @staticmethod
+    def _paa(values: np.ndarray, max_points: int) -> np.ndarray:
+        """PAA(Piecewise Aggregate Approximation)로 시퀀스를 max_points 구간 평균으로 축소"""
+        if len(values) <= max_points:
+            return values
+        bounds = np.linspace(0, len(values), max_points + 1).astype(int)
+        return np.add.reduceat(values, bounds[:-1]) / np.diff(bounds)
+
+
+# 프로세스 전체의 캐시 호출 수 (분석기가 요청마다 생성되어도 정리 주기 유지)
+_cache_call_count = 0
+_cache_call_lock = threading.Lock()
+
+# 워커 프로세스마다 한 번 생성되는 분석기 (프로세스 풀 전용)
+_worker_analyzer: Optional[PitchAnalyzer] = None
+
+
+def _analyze_pitch_cached(analyzer: PitchAnalyzer,
+                          config: PitchAnalysisConfig, audio_path: str,
+                          mtime_ns: int, size: int,
+                          time_range: Optional[TimeInterval]) -> PitchAnalysisResult:
+    """joblib 디스크 캐시용 피치 분석 (analyzer 외 인자가 캐시 키)"""
+    return analyzer._analyze_impl(Path(audio_path), time_range)
+
+
+def _init_pitch_worker(config: PitchAnalysisConfig):
+    """프로세스 풀 워커 초기화: 분석기는 워커당 한 번만 생성, 캐시 정리 안 함"""
+    global _worker_analyzer
+    _worker_analyzer = PitchAnalyzer(config, sweep_cache=False)
+
+
+def _analyze_pitch_in_worker(audio_path: Union[str, Path]) -> PitchAnalysisResult:
+    """프로세스 풀 워커용 피치 분석 (피클 가능하도록 모듈 수준 함수)"""
+    return _worker_analyzer.analyze(audio_path)
+
 
 # ========== 포먼트 분석기 ==========
 
@@ -470,55 +629,48 @@ class FormantAnalyzer:
             window_length=0.025,
             pre_emphasis_from=50.0)
 
-        # 포먼트 데이터 수집
-        formants = []
-        times = np.arange(0, sound.duration, time_step)
-
-        for t in times:
-            formant_values = {}
-            for i in range(1, self.num_formants + 1):
-                freq = formant.get_value_at_time(i, t)
-                if freq and not np.isnan(freq):
-                    formant_values[f'f{i}'] = freq
-
-            if 'f1' in formant_values and 'f2' in formant_values:
-                formants.append(
-                    FormantData(time=t,
-                                f1=formant_values['f1'],
-                                f2=formant_values['f2'],
-                                f3=formant_values.get('f3', 0.0),
-                                f4=formant_values.get('f4')))
-
-        # 평균 계산
+        # 포먼트별 프레임 값을 한 번에 읽음 (정의되지 않은 값은 0)
+        times = formant.xs()
+        num_columns = min(self.num_formants, 4)
+        formant_matrix = np.zeros((len(times), 4))
+        for i in range(num_columns):
+            formant_matrix[:, i] = call(formant, "To Matrix", i + 1).values[0]
+
+        # 포먼트 데이터 수집 (F1, F2가 모두 있는 프레임만)
+        valid = (formant_matrix[:, 0] > 0) & (formant_matrix[:, 1] > 0)
+        valid_matrix = formant_matrix[valid]
+        formants = [
+            FormantData(time=t, f1=f1, f2=f2, f3=f3, f4=f4 if f4 > 0 else None)
+            for t, (f1, f2, f3, f4) in zip(times[valid].tolist(),
+                                           valid_matrix.tolist())
+        ]
+
+        # 평균 계산 (포먼트별로 정의된 프레임만, 열 단위 한 번의 합산)
         if formants:
+            counts = np.count_nonzero(valid_matrix, axis=0)
+            means = valid_matrix.sum(axis=0) / np.maximum(counts, 1)
             average_formants = {
-                'f1': np.mean([f.f1 for f in formants]),
-                'f2': np.mean([f.f2 for f in formants]),
-                'f3': np.mean([f.f3 for f in formants if f.f3 > 0]),
-                'f4': np.mean([f.f4 for f in formants if f.f4])
+                f'f{i + 1}': float(mean)
+                for i, mean in enumerate(means)
             }
         else:
             average_formants = {'f1': 0.0, 'f2': 0.0, 'f3': 0.0, 'f4': 0.0}
 
-        # 모음 공간 면적 계산
-        vowel_space_area = self._calculate_vowel_space_area(formants)
+        # 모음 공간 면적 계산 (F1, F2 열을 그대로 사용)
+        vowel_space_area = self._calculate_vowel_space_area(valid_matrix[:, :2])
 
         return FormantAnalysisResult(formants=formants,
                                      average_formants=average_formants,
                                      vowel_space_area=vowel_space_area)
 
-    def _calculate_vowel_space_area(self,
-                                    formants: List[FormantData]) -> float:
-        """모음 공간 면적 계산"""
-        if not formants:
+    def _calculate_vowel_space_area(self, points: np.ndarray) -> float:
+        """모음 공간 면적 계산 (points: 프레임별 F1, F2 좌표 배열)"""
+        if len(points) == 0:
             return 0.0
 
         try:
             from scipy.spatial import ConvexHull
 
-            # F1, F2 좌표
-            points = np.array([[f.f1, f.f2] for f in formants])
-
             # Convex Hull 계산
             hull = ConvexHull(points)
             return float(hull.volume)  # 2D에서는 면적
@@ -536,11 +688,12 @@ class SpectralAnalysisResult:
     spectral_envelope: np.ndarray
     frequency_bins: np.ndarray
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, binary: bool = False) -> Dict[str, Any]:
+        encode = _encode_array if binary else np.ndarray.tolist
         return {
             'spectral_features': self.spectral_features.to_dict(),
-            'spectral_envelope': self.spectral_envelope.tolist(),
-            'frequency_bins': self.frequency_bins.tolist()
+            'spectral_envelope': encode(self.spectral_envelope),
+            'frequency_bins': encode(self.frequency_bins)
         }
 
 
@@ -574,22 +727,24 @@ class SpectralAnalyzer:
         # 오디오 로드
         y, sr = librosa.load(str(audio_path), sr=None)
 
+        # STFT는 한 번만 계산해 모든 스펙트럼 특징에 재사용
+        D = librosa.stft(y, n_fft=self.n_fft, hop_length=self.hop_length)
+        magnitude = np.abs(D).astype(np.float32, copy=False)
+
         # 스펙트럼 특징 추출
         spectral_centroid = librosa.feature.spectral_centroid(
-            y=y, sr=sr, n_fft=self.n_fft, hop_length=self.hop_length)
+            S=magnitude, sr=sr, n_fft=self.n_fft, hop_length=self.hop_length)
         spectral_bandwidth = librosa.feature.spectral_bandwidth(
-            y=y, sr=sr, n_fft=self.n_fft, hop_length=self.hop_length)
+            S=magnitude, sr=sr, n_fft=self.n_fft, hop_length=self.hop_length)
         spectral_rolloff = librosa.feature.spectral_rolloff(
-            y=y, sr=sr, n_fft=self.n_fft, hop_length=self.hop_length)
+            S=magnitude, sr=sr, n_fft=self.n_fft, hop_length=self.hop_length)
         zero_crossing_rate = librosa.feature.zero_crossing_rate(
             y, frame_length=self.n_fft, hop_length=self.hop_length)
 
-        # MFCC
-        mfcc = librosa.feature.mfcc(y=y,
-                                    sr=sr,
-                                    n_mfcc=13,
-                                    n_fft=self.n_fft,
-                                    hop_length=self.hop_length)
+        # MFCC (파워 스펙트로그램 → 멜 → dB)
+        mel_spectrogram = librosa.feature.melspectrogram(S=magnitude**2, sr=sr)
+        mfcc = librosa.feature.mfcc(S=librosa.power_to_db(mel_spectrogram),
+                                    n_mfcc=13)
 
         # 평균값 계산
         spectral_features = SpectralFeatures(
@@ -600,8 +755,7 @@ class SpectralAnalyzer:
             mfcc=np.mean(mfcc, axis=1).tolist())
 
         # 스펙트럼 엔벨로프
-        D = librosa.stft(y, n_fft=self.n_fft, hop_length=self.hop_length)
-        spectral_envelope = np.mean(np.abs(D), axis=1)
+        spectral_envelope = np.mean(magnitude, axis=1)
         frequency_bins = librosa.fft_frequencies(sr=sr, n_fft=self.n_fft)
 
         return SpectralAnalysisResult(spectral_features=spectral_features,
@@ -3,13 +3,20 @@ ToneBridge Core 데이터 모델
 시스템 전체에서 사용되는 데이터 구조 정의
 """
 from typing import Tuple, List, Optional, Dict, Any, Union
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime
 from enum import Enum
 import json
 import numpy as np
 
+# Optional orjson import (C 기반 JSON 인코더, 없으면 표준 json 사용)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
 # ========== 열거형 정의 ==========
 
 
@@ -48,10 +55,15 @@ class Gender(Enum):
     UNKNOWN = "unknown"
 
 
+# to_dict 직렬화용 값 테이블 (None은 None으로)
+_LANGUAGE_VALUES = {None: None, **{m: m.value for m in Language}}
+_GENDER_VALUES = {None: None, **{m: m.value for m in Gender}}
+
+
 # ========== 기본 데이터 클래스 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeInterval:
     """시간 구간"""
     start: float
@@ -112,7 +124,7 @@ class AudioMetadata:
 # ========== 오디오 세그먼트 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
     """오디오 세그먼트"""
     id: str
@@ -136,15 +148,17 @@ class AudioSegment:
         return self.interval.duration
 
     def to_dict(self) -> Dict[str, Any]:
+        # 프로퍼티를 거치지 않고 구간 값을 한 번만 읽음
+        start, end = self.interval.start, self.interval.end
         return {
             'id': self.id,
-            'start': self.start,
-            'end': self.end,
-            'duration': self.duration,
+            'start': start,
+            'end': end,
+            'duration': end - start,
             'text': self.text,
             'confidence': self.confidence,
             'speaker_id': self.speaker_id,
-            'language': self.language.value if self.language else None,
+            'language': _LANGUAGE_VALUES[self.language],
             'metadata': self.metadata
         }
 
@@ -152,7 +166,7 @@ class AudioSegment:
 # ========== 피치 데이터 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchPoint:
     """피치 포인트"""
     time: float
@@ -167,6 +181,22 @@ class PitchPoint:
         }
 
 
+@dataclass
+class PitchTrack:
+    """피치 트랙 (시간/주파수/강도를 병렬 배열로 저장)"""
+    times: np.ndarray
+    frequencies: np.ndarray
+    strengths: np.ndarray
+
+    def to_points(self) -> List[PitchPoint]:
+        """PitchPoint 리스트로 변환"""
+        return [
+            PitchPoint(time=t, frequency=f, strength=s)
+            for t, f, s in zip(self.times.tolist(), self.frequencies.tolist(),
+                               self.strengths.tolist())
+        ]
+
+
 @dataclass
 class PitchData:
     """피치 데이터"""
@@ -176,48 +206,101 @@ class PitchData:
     max_pitch: float
     mean_pitch: Optional[float] = None
     std_pitch: Optional[float] = None
-
-    def __post_init__(self):
-        """통계 계산"""
-        if self.points:
-            frequencies = [p.frequency for p in self.points if p.frequency > 0]
-            if frequencies:
-                self.mean_pitch = float(np.mean(frequencies))
-                self.std_pitch = float(np.std(frequencies))
+    # 분석기가 이미 가진 배열 (주어지면 points에서 배열을 다시 만들지 않음)
+    track: InitVar[Optional[PitchTrack]] = None
+
+    # points 에서 파생되는 내부 상태 (_times, _pitch_range, _cached_dict)는
+    # dataclass 필드가 아닌 인스턴스 속성으로 두어 fields()/asdict()에서 제외
+
+    def __post_init__(self, track: Optional[PitchTrack]):
+        """파생 상태 계산"""
+        self._refresh_derived(track, initial=True)
+
+    def __setattr__(self, name: str, value: Any):
+        """points 재할당 시 파생 상태 재계산, 그 외 공개 필드 변경 시 to_dict 캐시 무효화"""
+        object.__setattr__(self, name, value)
+        if name == 'points' and '_times' in self.__dict__:
+            self._refresh_derived(None, initial=False)
+        elif not name.startswith('_'):
+            object.__setattr__(self, '_cached_dict', None)
+
+    def _refresh_derived(self, track: Optional[PitchTrack], initial: bool):
+        """
+        시간 배열과 통계 계산 (유성음 주파수 배열에서 한 번에)
+
+        생성 시에는 유성음이 없으면 전달된 mean/std 값을 유지하고,
+        points 재할당 시에는 None 으로 초기화
+        """
+        # numba 로딩을 모듈 import 시점이 아닌 첫 사용 시점으로 미룸
+        from tonebridge_core._pitch_stats import voiced_stats
+
+        if track is not None:
+            times = np.asarray(track.times, dtype=np.float64)
+            frequencies = np.asarray(track.frequencies, dtype=np.float64)
+        else:
+            times = np.fromiter((p.time for p in self.points),
+                                dtype=np.float64,
+                                count=len(self.points))
+            frequencies = np.fromiter((p.frequency for p in self.points),
+                                      dtype=np.float64,
+                                      count=len(self.points))
+
+        count, mean, std, pitch_range = voiced_stats(frequencies)
+        object.__setattr__(self, '_times', times)
+        object.__setattr__(self, '_pitch_range',
+                           float(pitch_range) if count else 0.0)
+        object.__setattr__(self, '_cached_dict', None)
+        if count:
+            object.__setattr__(self, 'mean_pitch', float(mean))
+            object.__setattr__(self, 'std_pitch', float(std))
+        elif not initial:
+            object.__setattr__(self, 'mean_pitch', None)
+            object.__setattr__(self, 'std_pitch', None)
 
     @property
     def pitch_range(self) -> float:
         """피치 범위"""
-        if not self.points:
-            return 0.0
-        frequencies = [p.frequency for p in self.points if p.frequency > 0]
-        if not frequencies:
-            return 0.0
-        return max(frequencies) - min(frequencies)
+        return self._pitch_range
 
     def get_pitch_at_time(self, time: float) -> Optional[float]:
-        """특정 시간의 피치 값"""
-        for point in self.points:
-            if abs(point.time - time) < self.time_step / 2:
-                return point.frequency
+        """특정 시간의 피치 값 (시간순 포인트에서 이분 탐색)"""
+        index = int(np.searchsorted(self._times, time))
+        for i in (index - 1, index):
+            if 0 <= i < len(self._times) and \
+                    abs(self._times[i] - time) < self.time_step / 2:
+                return self.points[i].frequency
         return None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'points': [p.to_dict() for p in self.points],
-            'time_step': self.time_step,
-            'min_pitch': self.min_pitch,
-            'max_pitch': self.max_pitch,
-            'mean_pitch': self.mean_pitch,
-            'std_pitch': self.std_pitch,
-            'pitch_range': self.pitch_range
-        }
+        """
+        딕셔너리 변환
+
+        결과는 캐시되며 필드 재할당 시 무효화됨. 호출자가 최상위 키를 바꿔도
+        캐시에 영향이 없도록 얕은 복사본을 반환 (points 리스트는 공유되므로
+        수정하지 말 것, points 내용 변경은 리스트 재할당으로 반영)
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                # PitchPoint.to_dict 메서드 호출 없이 슬롯에서 직접 구성
+                'points': [{
+                    'time': p.time,
+                    'frequency': p.frequency,
+                    'strength': p.strength
+                } for p in self.points],
+                'time_step': self.time_step,
+                'min_pitch': self.min_pitch,
+                'max_pitch': self.max_pitch,
+                'mean_pitch': self.mean_pitch,
+                'std_pitch': self.std_pitch,
+                'pitch_range': self.pitch_range
+            }
+        return dict(self._cached_dict)
 
 
 # ========== TextGrid 데이터 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class TextGridInterval:
     """TextGrid 구간"""
     xmin: float
@@ -237,7 +320,7 @@ class TextGridInterval:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TextGridPoint:
     """TextGrid 포인트"""
     time: float
@@ -256,6 +339,8 @@ class TextGridTier:
     xmax: float
     intervals: Optional[List[TextGridInterval]] = None
     points: Optional[List[TextGridPoint]] = None
+    _xmins: Optional[np.ndarray] = field(default=None, init=False,
+                                         repr=False, compare=False)
 
     def __post_init__(self):
         """티어 타입에 따라 초기화"""
@@ -276,6 +361,22 @@ class TextGridTier:
         else:
             return len(self.points) if self.points else 0
 
+    def get_interval_at_time(self, time: float) -> Optional[TextGridInterval]:
+        """특정 시간을 포함하는 인터벌 (시작 시간 배열에서 이분 탐색)"""
+        if not self.intervals:
+            return None
+
+        # 인터벌이 추가되면 시작 시간 배열 재생성
+        if self._xmins is None or len(self._xmins) != len(self.intervals):
+            self._xmins = np.fromiter((i.xmin for i in self.intervals),
+                                      dtype=np.float64,
+                                      count=len(self.intervals))
+
+        index = int(np.searchsorted(self._xmins, time, side='right')) - 1
+        if index >= 0 and time <= self.intervals[index].xmax:
+            return self.intervals[index]
+        return None
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'name':
@@ -303,6 +404,18 @@ class TextGridData:
     tiers: List[TextGridTier]
     file_type: str = "ooTextFile"
     object_class: str = "TextGrid"
+    _tier_index: Dict[str, int] = field(default_factory=dict, init=False,
+                                        repr=False, compare=False)
+
+    def __post_init__(self):
+        """티어 이름 인덱스 생성"""
+        self._rebuild_tier_index()
+
+    def _rebuild_tier_index(self):
+        """티어 이름 → 위치 매핑 재구성 (같은 이름은 첫 티어 우선)"""
+        self._tier_index = {}
+        for index, tier in enumerate(self.tiers):
+            self._tier_index.setdefault(tier.name, index)
 
     @property
     def duration(self) -> float:
@@ -316,13 +429,17 @@ class TextGridData:
 
     def get_tier(self, name: str) -> Optional[TextGridTier]:
         """이름으로 티어 찾기"""
-        for tier in self.tiers:
-            if tier.name == name:
-                return tier
-        return None
+        index = self._tier_index.get(name)
+        if index is None or index >= len(self.tiers) or \
+                self.tiers[index].name != name:
+            # 티어 리스트나 이름이 외부에서 바뀐 경우 인덱스 재구성
+            self._rebuild_tier_index()
+            index = self._tier_index.get(name)
+        return None if index is None else self.tiers[index]
 
     def add_tier(self, tier: TextGridTier):
         """티어 추가"""
+        self._tier_index.setdefault(tier.name, len(self.tiers))
         self.tiers.append(tier)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -338,7 +455,7 @@ class TextGridData:
 
     def to_json(self) -> str:
         """JSON 문자열로 변환"""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return dumps_json(self.to_dict())
 
 
 # ========== 분석 결과 ==========
@@ -363,7 +480,7 @@ class SpectralFeatures:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FormantData:
     """포먼트 데이터"""
     time: float
@@ -402,6 +519,7 @@ class AnalysisResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
         return {
             'audio_metadata':
             self.audio_metadata.to_dict(),
@@ -418,9 +536,9 @@ class AnalysisResult:
             'transcription':
             self.transcription,
             'language':
-            self.language.value if self.language else None,
+            _LANGUAGE_VALUES[self.language],
             'gender':
-            self.gender.value if self.gender else None,
+            _GENDER_VALUES[self.gender],
             'processing_time':
             self.processing_time,
             'status':
@@ -433,7 +551,7 @@ class AnalysisResult:
 
     def to_json(self) -> str:
         """JSON 문자열로 변환"""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return dumps_json(self.to_dict())
 
 
 # ========== 사용자 프로필 ==========
@@ -562,6 +680,43 @@ class ProcessingConfig:
 # ========== 유틸리티 함수 ==========
 
 
+def dumps_json_bytes(data: Any) -> bytes:
+    """들여쓰기 2칸의 UTF-8 JSON 바이트로 변환 (orjson 우선, 파일 쓰기용)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data,
+                            option=orjson.OPT_INDENT_2
+                            | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def dumps_json(data: Any) -> str:
+    """들여쓰기 2칸의 UTF-8 JSON 문자열로 변환 (orjson 우선)"""
+    if HAS_ORJSON:
+        return dumps_json_bytes(data).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def interval_overlaps_matrix(a_starts: np.ndarray, a_ends: np.ndarray,
+                             b_starts: np.ndarray,
+                             b_ends: np.ndarray) -> np.ndarray:
+    """
+    구간 집합 간 겹침 행렬 (TimeInterval.overlaps의 일괄 버전)
+
+    Args:
+        a_starts, a_ends: N개 구간의 시작/끝
+        b_starts, b_ends: M개 구간의 시작/끝
+
+    Returns:
+        (N, M) 불리언 배열, [i, j]는 a의 i번째와 b의 j번째 구간이 겹치는지 여부
+    """
+    a_starts = np.asarray(a_starts, dtype=np.float64)[:, None]
+    a_ends = np.asarray(a_ends, dtype=np.float64)[:, None]
+    b_starts = np.asarray(b_starts, dtype=np.float64)[None, :]
+    b_ends = np.asarray(b_ends, dtype=np.float64)[None, :]
+    return ~((a_ends <= b_starts) | (b_ends <= a_starts))
+
+
 def create_empty_textgrid(duration: float) -> TextGridData:
     """빈 TextGrid 생성"""
     return TextGridData(xmin=0.0, xmax=duration, tiers=[])
@@ -571,28 +726,22 @@ def create_interval_tier(
         name: str, duration: float,
         intervals: List[Tuple[float, float, str]]) -> TextGridTier:
     """인터벌 티어 생성"""
-    tier = TextGridTier(name=name,
+    return TextGridTier(name=name,
                         tier_type="IntervalTier",
                         xmin=0.0,
                         xmax=duration,
-                        intervals=[])
-
-    for xmin, xmax, text in intervals:
-        tier.intervals.append(TextGridInterval(xmin, xmax, text))
-
-    return tier
+                        intervals=[
+                            TextGridInterval(xmin, xmax, text)
+                            for xmin, xmax, text in intervals
+                        ])
 
 
 def create_point_tier(name: str, duration: float,
                       points: List[Tuple[float, str]]) -> TextGridTier:
     """포인트 티어 생성"""
-    tier = TextGridTier(name=name,
+    return TextGridTier(name=name,
                         tier_type="TextTier",
                         xmin=0.0,
                         xmax=duration,
-                        points=[])
-
-    for time, mark in points:
-        tier.points.append(TextGridPoint(time, mark))
-
-    return tier
+                        points=[TextGridPoint(time, mark)
+                                for time, mark in points])
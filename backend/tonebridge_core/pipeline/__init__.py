@@ -6,8 +6,9 @@ ToneBridge 처리 파이프라인 모듈
 from .voice_processor import (VoiceProcessor, ProcessingPipeline,
                               PipelineConfig, PipelineStage, PipelineResult,
                               BatchProcessor)
+from .stage_cache import StageCache
 
 __all__ = [
     "VoiceProcessor", "ProcessingPipeline", "PipelineConfig", "PipelineStage",
-    "PipelineResult", "BatchProcessor"
+    "PipelineResult", "BatchProcessor", "StageCache"
 ]
@@ -0,0 +1,171 @@
+"""
+파이프라인 단계 캐시
+(입력 오디오 내용 해시, 단계, 단계 관련 설정)을 키로 단계 결과를 디스크에 저장
+"""
+
+import hashlib
+import json
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+from config import settings
+from utils import get_logger, file_handler
+
+logger = get_logger(__name__)
+
+
+class StageCache:
+    """파이프라인 단계 결과 캐시"""
+
+    # 캐시 정리 주기 (set 호출 수)
+    SWEEP_INTERVAL = 100
+
+    def __init__(self,
+                 cache_dir: Optional[Path] = None,
+                 size_limit: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리
+            size_limit: 캐시 최대 크기 (바이트, None이면 설정값)
+        """
+        self.cache_dir = cache_dir or settings.CACHE_DIR / "pipeline"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.size_limit = (size_limit if size_limit is not None else
+                           settings.STAGE_CACHE_SIZE_LIMIT)
+
+        self._set_count = 0
+        self._lock = threading.Lock()
+
+        logger.info(f"StageCache 초기화: {self.cache_dir}")
+
+    def get_file_hash(self, audio_path: Union[str, Path]) -> str:
+        """캐시 키에 사용할 오디오 내용 해시 (파이프라인 실행당 한 번 계산)"""
+        file_hash = file_handler.get_file_hash(audio_path, 'sha256')[:16]
+        if not file_hash:
+            raise ValueError(f"캐시 키용 파일 해시 계산 실패: {audio_path}")
+        return file_hash
+
+    def get_cache_key(self, file_hash: str, stage: str,
+                      config_subset: Dict[str, Any]) -> str:
+        """캐시 키 생성 (파일 내용 해시/단계/설정 해시)"""
+        if not file_hash:
+            raise ValueError("빈 파일 해시로는 캐시 키를 만들 수 없습니다")
+
+        config_str = json.dumps(config_subset, sort_keys=True, default=str)
+        config_hash = hashlib.blake2b(config_str.encode(),
+                                      digest_size=8).hexdigest()
+
+        return f"{file_hash}/{stage}_{config_hash}"
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """캐시에서 단계 결과 가져오기"""
+        cache_file = self.cache_dir / f"{cache_key}.pkl"
+
+        if cache_file.exists():
+            try:
+                # 캐시 유효성 검사 (TTL)
+                age = time.time() - cache_file.stat().st_mtime
+                if age >= settings.CACHE_TTL:
+                    logger.debug(f"단계 캐시 만료: {cache_key}")
+                    cache_file.unlink()
+                    return None
+
+                with open(cache_file, 'rb') as f:
+                    data = pickle.load(f)
+
+                logger.debug(f"단계 캐시 히트: {cache_key}")
+                return data
+
+            except Exception as e:
+                logger.warning(f"단계 캐시 읽기 실패: {e}")
+
+        return None
+
+    def set(self, cache_key: str, data: Dict[str, Any]):
+        """단계 결과를 캐시에 저장"""
+        cache_file = self.cache_dir / f"{cache_key}.pkl"
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            logger.debug(f"단계 캐시 저장: {cache_key}")
+
+        except Exception as e:
+            logger.warning(f"단계 캐시 저장 실패: {e}")
+
+        with self._lock:
+            self._set_count += 1
+            due = self._set_count % self.SWEEP_INTERVAL == 0
+        if due:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """
+        캐시 정리
+
+        CACHE_TTL 이 지난 항목을 삭제하고, 남은 항목이 size_limit 를 넘으면
+        오래 전에 저장된 항목부터 삭제 (다시 읽히지 않는 항목도 회수됨)
+
+        Returns:
+            삭제한 항목 수
+        """
+        now = time.time()
+        removed = 0
+        entries = []
+
+        for cache_file in self.cache_dir.glob("*/*.pkl"):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+
+            if now - stat.st_mtime >= settings.CACHE_TTL:
+                removed += self._remove(cache_file)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+        total_size = sum(size for _, size, _ in entries)
+        if total_size > self.size_limit:
+            entries.sort(key=lambda entry: entry[0])
+            for _, size, cache_file in entries:
+                if total_size <= self.size_limit:
+                    break
+                removed += self._remove(cache_file)
+                total_size -= size
+
+        # 비어 있는 파일 해시 디렉토리 정리
+        for hash_dir in self.cache_dir.iterdir():
+            if hash_dir.is_dir():
+                try:
+                    hash_dir.rmdir()
+                except OSError:
+                    pass
+
+        if removed:
+            logger.info(f"단계 캐시 정리: {removed}개 삭제")
+        return removed
+
+    @staticmethod
+    def _remove(cache_file: Path) -> int:
+        """캐시 파일 삭제 (다른 프로세스가 먼저 지웠으면 0)"""
+        try:
+            cache_file.unlink()
+            return 1
+        except OSError:
+            return 0
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for cache_file in self.cache_dir.glob("*/*.pkl"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+        logger.info("단계 캐시 삭제 완료")
@@ -8,7 +8,6 @@ import warnings
 warnings.filterwarnings('ignore')
 
 import time
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Callable
 from dataclasses import dataclass, field
@@ -16,6 +15,7 @@ from enum import Enum
 from datetime import datetime
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 import uuid
 
 # 오디오 처리
@@ -34,11 +34,13 @@ from core import (AudioNormalizer, AudioQualityEnhancer, KoreanAudioOptimizer,
 # ToneBridge Core 모듈
 from tonebridge_core.models import (ProcessingStatus, AudioFormat, Language,
                                     AudioMetadata, AnalysisResult,
-                                    ProcessingConfig)
+                                    ProcessingConfig, dumps_json,
+                                    dumps_json_bytes)
 from tonebridge_core.analysis import PitchAnalyzer, FormantAnalyzer, SpectralAnalyzer
 from tonebridge_core.segmentation import KoreanSegmenter
 from tonebridge_core.stt import UniversalSTT
 from tonebridge_core.textgrid import TextGridGenerator
+from tonebridge_core.pipeline.stage_cache import StageCache
 
 logger = get_logger(__name__)
 performance_logger = PerformanceLogger()
@@ -61,6 +63,17 @@ class PipelineStage(Enum):
     POSTPROCESSING = "postprocessing"
 
 
+# 캐시 가능한 단계와 그 결과에 영향을 주는 설정 항목
+# (입력 오디오는 내용 해시로 키에 포함되므로 앞 단계 설정은 자동 반영)
+CACHEABLE_STAGE_CONFIG = {
+    PipelineStage.ANALYSIS:
+    ('analyze_pitch', 'analyze_formants', 'analyze_spectrum'),
+    PipelineStage.SEGMENTATION: ('language', ),
+    PipelineStage.TRANSCRIPTION:
+    ('stt_engine', 'stt_language', 'enable_multi_engine'),
+}
+
+
 # ========== 설정 클래스 ==========
 
 
@@ -208,7 +221,7 @@ class PipelineResult:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return dumps_json(self.to_dict())
 
     def get_stage_result(self, stage: PipelineStage) -> Optional[StageResult]:
         """특정 단계 결과 가져오기"""
@@ -224,10 +237,17 @@ class PipelineResult:
 class VoiceProcessor:
     """통합 음성 처리기"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, parallel_analysis: bool = True):
+        """
+        초기화
+
+        Args:
+            parallel_analysis: 분석 단계에서 스펙트럼 분석을 별도 스레드로 실행
+                (배치 워커 프로세스처럼 이미 병렬로 도는 곳에서는 False)
+        """
         # 컴포넌트 초기화
         self.file_handler = file_handler
+        self.parallel_analysis = parallel_analysis
         self.audio_normalizer = AudioNormalizer()
         self.audio_enhancer = AudioQualityEnhancer()
         self.korean_optimizer = KoreanAudioOptimizer()
@@ -240,6 +260,7 @@ class VoiceProcessor:
         self.universal_stt = UniversalSTT()
         self.textgrid_generator = TextGridGenerator()
         self.quality_validator = QualityValidator()
+        self.stage_cache = StageCache() if settings.ENABLE_CACHE else None
 
         logger.info("VoiceProcessor 초기화 완료")
 
@@ -308,12 +329,16 @@ class VoiceProcessor:
                 if stage_result and 'output_path' in stage_result.data:
                     current_audio = Path(stage_result.data['output_path'])
 
+            # 단계 캐시 키용 오디오 해시 (분석/분절/전사 단계가 공유)
+            audio_hash = self._get_stage_cache_hash(current_audio, config)
+
             # 5. 분석
             analysis_data = {}
             if config.enable_analysis:
                 stage_result = self._run_stage(
                     result, PipelineStage.ANALYSIS,
-                    lambda: self._analyze(current_audio, config))
+                    lambda: self._analyze(current_audio, config),
+                    audio_hash=audio_hash)
                 if stage_result:
                     analysis_data = stage_result.data
 
@@ -322,7 +347,8 @@ class VoiceProcessor:
             if config.enable_segmentation:
                 stage_result = self._run_stage(
                     result, PipelineStage.SEGMENTATION,
-                    lambda: self._segment(current_audio, config))
+                    lambda: self._segment(current_audio, config),
+                    audio_hash=audio_hash)
                 if stage_result and 'segments' in stage_result.data:
                     segments = stage_result.data['segments']
 
@@ -331,7 +357,8 @@ class VoiceProcessor:
             if config.enable_transcription:
                 stage_result = self._run_stage(
                     result, PipelineStage.TRANSCRIPTION,
-                    lambda: self._transcribe(current_audio, config))
+                    lambda: self._transcribe(current_audio, config),
+                    audio_hash=audio_hash)
                 if stage_result and 'transcription' in stage_result.data:
                     transcription = stage_result.data['transcription']
 
@@ -394,16 +421,54 @@ class VoiceProcessor:
 
         return result
 
-    def _run_stage(self, pipeline_result: PipelineResult, stage: PipelineStage,
-                   func: Callable) -> Optional[StageResult]:
-        """단계 실행"""
+    def _get_stage_cache_hash(self, audio_path: Path,
+                              config: PipelineConfig) -> Optional[str]:
+        """단계 캐시용 오디오 내용 해시 (캐시 비활성화/해시 실패 시 None)"""
+        if self.stage_cache is None or not config.use_cache:
+            return None
+
+        try:
+            return self.stage_cache.get_file_hash(audio_path)
+        except Exception as e:
+            logger.warning(f"단계 캐시 사용 안 함: {e}")
+            return None
+
+    def _run_stage(self,
+                   pipeline_result: PipelineResult,
+                   stage: PipelineStage,
+                   func: Callable,
+                   audio_hash: Optional[str] = None) -> Optional[StageResult]:
+        """
+        단계 실행
+
+        audio_hash가 주어지고 캐시 가능한 단계이면 (오디오 내용, 단계, 관련 설정)
+        키로 이전 결과를 재사용 (실패 결과는 캐시하지 않음)
+        """
         stage_result = StageResult(stage=stage,
                                    status=ProcessingStatus.PROCESSING,
                                    start_time=datetime.now())
 
+        config = pipeline_result.config
+
         try:
             logger.info(f"단계 시작: {stage.value}")
-            data = func()
+
+            cache_key = None
+            if audio_hash and stage in CACHEABLE_STAGE_CONFIG:
+                cache_key = self.stage_cache.get_cache_key(
+                    audio_hash, stage.value, {
+                        name: getattr(config, name)
+                        for name in CACHEABLE_STAGE_CONFIG[stage]
+                    })
+
+            data = self.stage_cache.get(cache_key) if cache_key else None
+            if data is not None:
+                logger.info(f"단계 캐시 사용: {stage.value}")
+            else:
+                data = func()
+                if (cache_key and isinstance(data, dict)
+                        and 'error' not in data):
+                    self.stage_cache.set(cache_key, data)
 
             stage_result.data = data if isinstance(data, dict) else {
                 'result': data
@@ -456,20 +521,20 @@ class VoiceProcessor:
         result = {'steps': []}
         current_path = audio_path
 
-        # 무음 제거
-        if config.remove_silence:
+        # 무음 제거 + 볼륨 정규화 (한 번 로드해 메모리에서 처리 후 한 번 저장)
+        if config.remove_silence or config.normalize_volume:
             temp_path = self.file_handler.create_temp_file(suffix=".wav")
-            current_path, ratio = self.audio_normalizer.remove_silence(
-                current_path, temp_path)
-            result['steps'].append('silence_removal')
-            result['silence_ratio'] = ratio
-
-        # 볼륨 정규화
-        if config.normalize_volume:
-            temp_path = self.file_handler.create_temp_file(suffix=".wav")
-            current_path = self.audio_normalizer.normalize_volume(
-                current_path, temp_path)
-            result['steps'].append('volume_normalization')
+            current_path, ratio = self.audio_normalizer.remove_silence_and_normalize(
+                current_path,
+                temp_path,
+                remove_silence=config.remove_silence,
+                normalize_volume=config.normalize_volume)
+
+            if config.remove_silence:
+                result['steps'].append('silence_removal')
+                result['silence_ratio'] = ratio
+            if config.normalize_volume:
+                result['steps'].append('volume_normalization')
 
         result['output_path'] = str(current_path)
         return result
@@ -498,28 +563,46 @@ class VoiceProcessor:
     def _analyze(self, audio_path: Path,
                  config: PipelineConfig) -> Dict[str, Any]:
         """분석 단계"""
-        result = {}
+        analysis = {}
+
+        # 스펙트럼 분석(librosa/NumPy FFT, GIL 해제)만 별도 스레드에서 실행하고
+        # Praat 기반 분석(GIL 유지)은 현재 스레드에서 순서대로 실행
+        spectral_future = None
+        executor = None
+        if config.analyze_spectrum and self.parallel_analysis:
+            executor = ThreadPoolExecutor(max_workers=1,
+                                          thread_name_prefix="spectral")
+            spectral_future = executor.submit(
+                lambda: self.spectral_analyzer.analyze(audio_path).to_dict())
 
-        # 피치 분석
-        if config.analyze_pitch:
-            pitch_result = self.pitch_analyzer.analyze(audio_path)
-            result['pitch'] = pitch_result.to_dict()
+        try:
+            # 피치 분석
+            if config.analyze_pitch:
+                analysis['pitch'] = self.pitch_analyzer.analyze(
+                    audio_path).to_dict()
 
-        # 포먼트 분석
-        if config.analyze_formants:
-            formant_result = self.formant_analyzer.analyze(audio_path)
-            result['formants'] = formant_result.to_dict()
+            # 포먼트 분석
+            if config.analyze_formants:
+                analysis['formants'] = self.formant_analyzer.analyze(
+                    audio_path).to_dict()
 
-        # 스펙트럼 분석
-        if config.analyze_spectrum:
-            spectral_result = self.spectral_analyzer.analyze(audio_path)
-            result['spectrum'] = spectral_result.to_dict()
+            # 스펙트럼 분석 (병렬 실행 시 자리만 잡아 두고 마지막에 채움)
+            if config.analyze_spectrum:
+                analysis['spectrum'] = (
+                    None if spectral_future is not None else
+                    self.spectral_analyzer.analyze(audio_path).to_dict())
 
-        # 음성 분석
-        voice_result = self.voice_analyzer.analyze_audio(audio_path)
-        result['voice'] = voice_result
+            # 음성 분석
+            analysis['voice'] = self.voice_analyzer.analyze_audio(audio_path)
 
-        return result
+            if spectral_future is not None:
+                analysis['spectrum'] = spectral_future.result()
+
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        return analysis
 
     def _segment(self, audio_path: Path,
                  config: PipelineConfig) -> Dict[str, Any]:
@@ -596,8 +679,8 @@ class VoiceProcessor:
         if output_dir and result.config.generate_report:
             # 보고서 생성
             report_path = output_dir / f"report_{result.pipeline_id}.json"
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(result.to_json())
+            with open(report_path, 'wb') as f:
+                f.write(dumps_json_bytes(result.to_dict()))
 
             return {'report_path': str(report_path)}
 
@@ -714,6 +797,23 @@ class ProcessingPipeline:
 
 # ========== 배치 처리기 ==========
 
+# 워커 프로세스마다 한 번 생성되는 처리기 (프로세스 풀 전용)
+_worker_processor: Optional[VoiceProcessor] = None
+
+
+def _init_batch_worker():
+    """프로세스 풀 워커 초기화: 모델 로딩은 워커당 한 번만"""
+    global _worker_processor
+    # 워커 프로세스 자체가 병렬 단위이므로 분석 단계 내부 스레드는 끔
+    _worker_processor = VoiceProcessor(parallel_analysis=False)
+
+
+def _process_in_worker(audio_file: Union[str, Path], config: PipelineConfig,
+                       output_dir: Optional[Path]) -> PipelineResult:
+    """프로세스 풀 워커용 처리 (피클 가능하도록 모듈 수준 함수)"""
+    return _worker_processor.process(audio_file, config, output_dir)
+
+
 
 class BatchProcessor:
     """배치 처리 관리"""
@@ -730,16 +830,26 @@ class BatchProcessor:
         """
         self.config = config or PipelineConfig()
         self.max_workers = max_workers or self.config.max_workers
-        self.processor = VoiceProcessor()
+        # 순차/스레드 처리에서만 쓰므로 처음 필요할 때 생성
+        # (프로세스 풀 처리는 워커마다 자체 처리기를 로드)
+        self._processor: Optional[VoiceProcessor] = None
 
         logger.info(f"BatchProcessor 초기화: 최대 {self.max_workers} 워커")
 
+    @property
+    def processor(self) -> VoiceProcessor:
+        """순차/스레드 처리용 처리기 (지연 생성)"""
+        if self._processor is None:
+            self._processor = VoiceProcessor()
+        return self._processor
+
     @handle_errors(context="batch_process")
     @log_execution_time
     def process_batch(self,
                       audio_files: List[Union[str, Path]],
                       output_dir: Optional[Path] = None,
-                      parallel: bool = None) -> List[PipelineResult]:
+                      parallel: bool = None,
+                      use_threads: bool = False) -> List[PipelineResult]:
         """
         배치 처리
 
@@ -747,6 +857,8 @@ class BatchProcessor:
             audio_files: 오디오 파일 리스트
             output_dir: 출력 디렉토리
             parallel: 병렬 처리 여부
+            use_threads: 병렬 처리 시 프로세스 대신 스레드 사용
+                (원격 STT 등 I/O 위주 설정용)
 
         Returns:
             처리 결과 리스트
@@ -759,12 +871,21 @@ class BatchProcessor:
             output_dir.mkdir(parents=True, exist_ok=True)
 
         if parallel:
-            # 병렬 처리
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 병렬 처리: CPU 바운드 분석은 GIL을 피하도록 프로세스 풀 사용
+            if use_threads:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                task = self.processor.process
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_batch_worker)
+                task = _process_in_worker
+
+            with executor:
                 futures = []
                 for audio_file in audio_files:
-                    future = executor.submit(self.processor.process,
-                                             audio_file, self.config,
+                    future = executor.submit(task, audio_file, self.config,
                                              output_dir)
                     futures.append(future)
 
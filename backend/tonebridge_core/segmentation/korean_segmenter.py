@@ -50,6 +50,9 @@ from tonebridge_core.models import TimeInterval, AudioSegment
 
 logger = get_logger(__name__)
 
+# 완성형 한글 음절 (U+AC00 ~ U+D7A3), findall 로 C 레벨에서 한 번에 추출
+HANGUL_SYLLABLE_PATTERN = re.compile('[가-힣]')
+
 # ========== 열거형 정의 ==========
 
 
@@ -65,7 +68,7 @@ class SegmentationType(Enum):
 # ========== 데이터 클래스 ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class SyllableSegment:
     """음절 세그먼트"""
     index: int
@@ -236,15 +239,23 @@ class KoreanPhonemeExtractor:
         Returns:
             [(음절, 초성, 중성, 종성), ...]
         """
-        phonemes = []
+        # 코드포인트 배열에서 한글 음절만 골라 자모 인덱스를 한 번에 계산
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        codes = codes[(codes >= 0xAC00) & (codes <= 0xD7A3)] - 0xAC00
+
+        initial_indices = codes // (21 * 28)
+        medial_indices = (codes % (21 * 28)) // 28
+        final_indices = codes % 28
 
-        for char in text:
-            if '가' <= char <= '힣':
-                initial, medial, final = KoreanPhonemeExtractor.decompose_syllable(
-                    char)
-                phonemes.append((char, initial, medial, final))
+        initials = KoreanPhonemeExtractor.INITIALS
+        medials = KoreanPhonemeExtractor.MEDIALS
+        finals = KoreanPhonemeExtractor.FINALS
 
-        return phonemes
+        return [(chr(0xAC00 + code), initials[i], medials[m], finals[f])
+                for code, i, m, f in zip(codes.tolist(),
+                                         initial_indices.tolist(),
+                                         medial_indices.tolist(),
+                                         final_indices.tolist())]
 
 
 # ========== 음절 경계 검출기 ==========
@@ -542,13 +553,11 @@ class KoreanSegmenter:
             sound = parselmouth.Sound(segment_audio, sr)
             pitch = sound.to_pitch()
 
-            pitch_values = []
-            for t in pitch.xs():
-                value = pitch.get_value_at_time(t)
-                if value and not np.isnan(value):
-                    pitch_values.append(value)
+            # 프레임별 주파수를 한 번에 읽고 유성음 프레임만 사용 (무성음은 0)
+            frequencies = pitch.selected_array['frequency']
+            pitch_values = frequencies[frequencies > 0]
 
-            if pitch_values:
+            if len(pitch_values) > 0:
                 segment.pitch_mean = float(np.mean(pitch_values))
                 segment.pitch_std = float(np.std(pitch_values))
         except:
@@ -565,10 +574,7 @@ class KoreanSegmenter:
                          text: str) -> List[SyllableSegment]:
         """텍스트와 정렬"""
         # 텍스트에서 음절 추출
-        syllables = []
-        for char in text:
-            if '가' <= char <= '힣':
-                syllables.append(char)
+        syllables = HANGUL_SYLLABLE_PATTERN.findall(text)
 
         # 세그먼트 수와 음절 수 맞추기
         if len(segments) == len(syllables):
@@ -653,10 +659,7 @@ class KoreanSegmenter:
                 end_time = stt_segment.get('end', 0.0)
 
                 # 텍스트에서 음절 추출
-                syllables = []
-                for char in text:
-                    if '가' <= char <= '힣':
-                        syllables.append(char)
+                syllables = HANGUL_SYLLABLE_PATTERN.findall(text)
 
                 if not syllables:
                     continue
@@ -98,11 +98,10 @@ class TextGridBuilder:
                             tier_type="IntervalTier",
                             xmin=self.xmin,
                             xmax=self.xmax,
-                            intervals=[])
-
-        # 인터벌 추가
-        for start, end, text in intervals:
-            tier.intervals.append(TextGridInterval(start, end, text))
+                            intervals=[
+                                TextGridInterval(start, end, text)
+                                for start, end, text in intervals
+                            ])
 
         self.tiers.append(tier)
         return self
@@ -123,11 +122,8 @@ class TextGridBuilder:
                             tier_type="TextTier",
                             xmin=self.xmin,
                             xmax=self.xmax,
-                            points=[])
-
-        # 포인트 추가
-        for time, mark in points:
-            tier.points.append(TextGridPoint(time, mark))
+                            points=[TextGridPoint(time, mark)
+                                    for time, mark in points])
 
         self.tiers.append(tier)
         return self
@@ -13,6 +13,7 @@ from typing import List, Dict, Tuple, Optional, Union, Any
 import re
 import logging
 import hashlib
+import functools
 from datetime import datetime
 
 # 오디오 관련
@@ -37,6 +38,25 @@ from config import settings
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _read_audio_header(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    오디오 헤더 정보 (파일 경로별 캐시)
+
+    mtime_ns, size 는 캐시 키로만 사용되며, 파일이 바뀌면 다시 읽음
+    """
+    info = sf.info(path)
+
+    return {
+        'duration': info.duration,
+        'sample_rate': info.samplerate,
+        'channels': info.channels,
+        'format': info.format,
+        'subtype': info.subtype,
+        'frames': info.frames
+    }
+
+
 class FileHandler:
     """파일 처리 통합 클래스"""
 
@@ -325,16 +345,13 @@ class FileHandler:
         file_path = Path(file_path)
 
         try:
-            info = sf.info(str(file_path))
+            stat = file_path.stat()
+            info = _read_audio_header(str(file_path), stat.st_mtime_ns,
+                                      stat.st_size)
 
             return {
-                'duration': info.duration,
-                'sample_rate': info.samplerate,
-                'channels': info.channels,
-                'format': info.format,
-                'subtype': info.subtype,
-                'frames': info.frames,
-                'file_size': file_path.stat().st_size,
+                **info,
+                'file_size': stat.st_size,
                 'file_name': file_path.name
             }
 